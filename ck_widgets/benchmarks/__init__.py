@@ -0,0 +1,6 @@
+"""Headless benchmarks of widget render and layout paths
+
+Run with `python -m ck_widgets.benchmarks`, see `--help`.
+"""
+from .harness import BENCHMARKS, benchmark, register, run_benchmarks, run_once
+from . import color, debug_window, list_view, value_bar
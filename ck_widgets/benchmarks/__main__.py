@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+from textual.geometry import Size
+
+from . import BENCHMARKS, run_benchmarks
+from .harness import Metrics
+
+Results = Dict[str, Metrics]
+
+
+def _version(package: str) -> Optional[str]:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def _lower_is_better(metric: str) -> Optional[bool]:
+    if metric.endswith("_per_s"):
+        return False
+    if metric.endswith(("_us", "_ms", "_s", "_kib")):
+        return True
+    return None
+
+
+def compare(old: Results, new: Results, threshold: float) -> List[str]:
+    """Print changes against `old`, returns regressed `name.metric`"""
+    console = Console()
+    table = Table("benchmark", "metric", "old", "new", "change", box=None)
+    regressions = []
+    for name, metrics in new.items():
+        for metric, value in metrics.items():
+            previous = old.get(name, {}).get(metric)
+            if not previous:
+                continue
+            change = value / previous - 1
+            lower = _lower_is_better(metric)
+            worse = lower is not None and (change if lower else -change) > threshold
+            better = lower is not None and (-change if lower else change) > threshold
+            style = "red" if worse else "green" if better else ""
+            if worse:
+                regressions.append(f"{name}.{metric}")
+            table.add_row(
+                name,
+                metric,
+                f"{previous:.4g}",
+                f"{value:.4g}",
+                f"[{style}]{change:+.1%}[/]" if style else f"{change:+.1%}",
+            )
+    console.print(table)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ck_widgets.benchmarks",
+        description="Headless benchmarks of ck_widgets, rendered to a null file",
+    )
+    parser.add_argument(
+        "patterns", nargs="*", default=["*"], help="benchmark names or glob patterns"
+    )
+    parser.add_argument("-l", "--list", action="store_true", help="list benchmarks")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per benchmark")
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("-c", "--compare", help="JSON results to compare with")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative change counted as regression (default 0.1)",
+    )
+    parser.add_argument("--size", default="200x60", help="screen size, WIDTHxHEIGHT")
+    args = parser.parse_args(argv)
+
+    names = [
+        name
+        for name in BENCHMARKS
+        # Exact names too, `[...]` in names reads as a glob character set
+        if any(name == pattern or fnmatch(name, pattern) for pattern in args.patterns)
+    ]
+    if not names:
+        parser.error(f"no benchmarks match {' '.join(args.patterns)}")
+    if args.list:
+        print("\n".join(names))
+        return 0
+    width, height = (int(part) for part in args.size.split("x"))
+
+    def progress(name: str, metrics: Metrics) -> None:
+        values = "  ".join(f"{key}={value:.4g}" for key, value in metrics.items())
+        print(f"{name:44s} {values}", file=sys.stderr)
+
+    results = run_benchmarks(names, args.repeat, Size(width, height), progress)
+    report = {
+        "meta": {
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "textual": _version("textual"),
+            "rich": _version("rich"),
+            "numpy": _version("numpy"),
+            "repeat": args.repeat,
+            "size": [width, height],
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            old = json.load(file)["results"]
+        regressions = compare(old, results, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regressions", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from functools import partial
+
+from textual.app import App
+from textual.geometry import Size
+
+from ck_widgets.color import ColorPalette, CustomColor, create_gradient
+from ck_widgets.widgets import ValueBarV
+
+from .harness import Metrics, per_call, register
+
+
+async def gradient(size: int, app: App) -> Metrics:
+    return {
+        "create_gradient_us": per_call(
+            lambda: create_gradient("rgb(10,20,30)", "rgb(200,100,50)", size), 200
+        )
+        * 1e6,
+        "custom_color_us": per_call(
+            lambda: CustomColor.gradient("red", "blue", size), 200
+        )
+        * 1e6,
+    }
+
+
+async def lookup(size: int, app: App) -> Metrics:
+    auto = CustomColor.gradient("red", "blue")
+    listed = CustomColor.gradient("red", "blue", size)
+
+    def cold() -> None:
+        auto.clear_cache()
+        ColorPalette(auto).colors(size)
+
+    palette = ColorPalette(auto)
+    palette.colors(size)
+
+    def get_color() -> None:
+        for index in range(size):
+            listed.get_color(index)
+
+    return {
+        "palette_cold_us": per_call(cold, 200) * 1e6,
+        "palette_warm_us": per_call(lambda: palette.colors(size), 2000) * 1e6,
+        "get_color_all_us": per_call(get_color, 200) * 1e6,
+    }
+
+
+async def memory(bars: int, app: App) -> Metrics:
+    """Create, use and drop gradients with their bars `bars` times"""
+
+    def cycle(index: int) -> None:
+        color = CustomColor.gradient(f"rgb({index % 256},0,0)", "blue")
+        color.get_color(3, 40)
+        color.get_color(5, 80)
+        bar = ValueBarV(max_value=20, width=5, color=color, scheduler=None)
+        bar._size = Size(bar.width, bar.height)
+        bar.render_lines()
+
+    def custom_colors() -> int:
+        return sum(isinstance(obj, CustomColor) for obj in gc.get_objects())
+
+    gc.collect()
+    before = custom_colors()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for index in range(bars):
+            cycle(index)
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "custom_colors_alive": custom_colors() - before,
+        "traced_kib": (current - start) / 1024,
+        "peak_kib": (peak - start) / 1024,
+    }
+
+
+for size in (32, 256, 2048):
+    register(f"color.gradient[{size}]", partial(gradient, size))
+    register(f"color.lookup[{size}]", partial(lookup, size))
+register("color.memory[3000]", partial(memory, 3000))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+from functools import partial
+
+from textual.app import App
+
+from ck_widgets.widgets import DebugWindow
+
+from .harness import Metrics, per_call, register, wait_idle
+
+
+async def status(keys: int, app: App) -> Metrics:
+    window = DebugWindow()
+    await app.view.dock(window)
+    await wait_idle(app)
+    window.scheduler = None
+    options = app.console.options.update(
+        width=window.size.width, height=window.size.height
+    )
+    for index in range(keys):
+        window.set_status(f"bar {index}", f"[green]{index}[/] Value: [yellow]0[/]/100")
+    app.console.render_lines(window.render(), options)
+    rnd = random.Random(0)
+
+    def step() -> None:
+        index = rnd.randrange(keys)
+        value = rnd.randrange(101)
+        window.set_status(
+            f"bar {index}", f"[green]{index}[/] Value: [yellow]{value}[/]/100"
+        )
+        app.console.render_lines(window.render(), options)
+
+    def write_line() -> None:
+        window.write_line("[blue]event[/]", rnd.randrange(1000))
+        app.console.render_lines(window.render(), options)
+
+    return {
+        "update_render_us": per_call(step, 500) * 1e6,
+        "log_render_us": per_call(write_line, 500) * 1e6,
+    }
+
+
+register("debug_window.status[100]", partial(status, 100))
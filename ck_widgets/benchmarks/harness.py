@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tracemalloc
+from statistics import median
+from time import perf_counter
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from rich.console import Console
+from textual import events
+from textual.app import App
+from textual.driver import Driver
+from textual.geometry import Size
+
+Metrics = Dict[str, float]
+BenchmarkFunc = Callable[[App], Awaitable[Metrics]]
+
+BENCHMARKS: Dict[str, BenchmarkFunc] = {}
+
+
+def register(name: str, func: BenchmarkFunc) -> None:
+    if name in BENCHMARKS:
+        raise ValueError(f"benchmark {name!r} is already registered")
+    BENCHMARKS[name] = func
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFunc], BenchmarkFunc]:
+    """Register decorated `async def(app) -> metrics` under `name`
+
+    Metrics ending with `_us`, `_ms` or `_s` are durations, `_kib` are
+    memory sizes, the ones ending with `_per_s` are rates, others are
+    counts.
+    """
+
+    def decorator(func: BenchmarkFunc) -> BenchmarkFunc:
+        register(name, func)
+        return func
+
+    return decorator
+
+
+def per_call(func: Callable[[], object], number: int) -> float:
+    """Seconds per call of `func`, called `number` times"""
+    start = perf_counter()
+    for _ in range(number):
+        func()
+    return (perf_counter() - start) / number
+
+
+def allocations(func: Callable[[], object], number: int) -> Metrics:
+    """Styles created and median peak of traced memory per call of `func`
+
+    Styles are misses of the style caches counted by `instrumentation`.
+    """
+    from ck_widgets.widgets import instrumentation
+
+    styles = instrumentation.styles_created
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+    return {
+        "styles_per_call": (instrumentation.styles_created - styles) / number,
+        "alloc_peak_kib": median(peaks) / 1024,
+    }
+
+
+async def wait_idle(app: App, timeout: float = 30.0) -> None:
+    """Wait until the app and all its widgets have no queued messages"""
+    deadline = perf_counter() + timeout
+    quiet = 0
+    while quiet < 2 and perf_counter() < deadline:
+        await asyncio.sleep(0)
+        pumps = [app, *app.children]
+        if all(pump._message_queue.empty() for pump in pumps):
+            quiet += 1
+        else:
+            quiet = 0
+
+
+class _HeadlessDriver(Driver):
+    def start_application_mode(self) -> None:
+        self.send_event(events.Resize(self._target, self._target.bench_size))
+
+    def disable_input(self) -> None:
+        pass
+
+    def stop_application_mode(self) -> None:
+        pass
+
+
+class BenchmarkApp(App):
+    """App without terminal, everything is rendered to a null file"""
+
+    def __init__(self, func: BenchmarkFunc, size: Size) -> None:
+        self.bench_size = size
+        self._null_file = open(os.devnull, "w")
+        self._console = Console(
+            file=self._null_file,
+            width=size.width,
+            height=size.height,
+            force_terminal=True,
+            color_system="truecolor",
+            legacy_windows=False,
+        )
+        super().__init__(driver_class=_HeadlessDriver)
+        self.func = func
+        self.metrics: Optional[Metrics] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def console(self) -> Console:
+        return self._console
+
+    @console.setter
+    def console(self, console: Console) -> None:
+        # App replaces its console on start
+        pass
+
+    async def on_load(self, event: events.Load) -> None:
+        asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while not self.view.size:
+                await asyncio.sleep(0.01)
+            await wait_idle(self)
+            self.metrics = await self.func(self)
+        except Exception as error:
+            self.error = error
+        finally:
+            await self.shutdown()
+
+
+def run_once(func: BenchmarkFunc, size: Size = Size(200, 60)) -> Metrics:
+    """Run `func` in a new headless app, returns its metrics"""
+    app = BenchmarkApp(func, size)
+    try:
+        asyncio.run(app.process_messages())
+    finally:
+        app._null_file.close()
+    if app.error is not None:
+        raise app.error
+    if app.metrics is None:
+        raise RuntimeError("benchmark did not finish")
+    return app.metrics
+
+
+def run_benchmarks(
+    names: List[str],
+    repeat: int = 3,
+    size: Size = Size(200, 60),
+    progress: Optional[Callable[[str, Metrics], None]] = None,
+) -> Dict[str, Metrics]:
+    """Median of each metric over `repeat` runs, for each benchmark"""
+    results: Dict[str, Metrics] = {}
+    for name in names:
+        runs = [run_once(BENCHMARKS[name], size) for _ in range(repeat)]
+        metrics = {key: median(run[key] for run in runs) for key in runs[0]}
+        results[name] = metrics
+        if progress is not None:
+            progress(name, metrics)
+    return results
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from time import perf_counter
+
+from rich.text import Text
+from textual.app import App
+
+from ck_widgets.widgets import ListViewUo
+
+from .harness import Metrics, register, wait_idle
+
+
+def _row(index: int) -> Text:
+    # Every fourth row is two lines high
+    return Text(f"row {index}" + "\nsecond line" * (index % 4 == 1))
+
+
+async def _docked(app: App, list_view: ListViewUo) -> ListViewUo:
+    await app.view.dock(list_view)
+    await wait_idle(app)
+    return list_view
+
+
+async def add_remove(count: int, lightweight: bool, app: App) -> Metrics:
+    list_view = await _docked(app, ListViewUo(lightweight=lightweight))
+    rows = [_row(index) for index in range(count)]
+
+    start = perf_counter()
+    await list_view.add_widgets(rows)
+    await wait_idle(app)
+    add = perf_counter() - start
+
+    start = perf_counter()
+    for index in range(50):
+        await list_view.add_widget(_row(-index), index * count // 50)
+    await wait_idle(app)
+    insert = (perf_counter() - start) / 50
+
+    start = perf_counter()
+    await list_view.remove_widgets(list(range(0, len(list_view.window.layout), 10)))
+    await wait_idle(app)
+    remove = perf_counter() - start
+    return {"add_ms": add * 1e3, "insert_ms": insert * 1e3, "remove_ms": remove * 1e3}
+
+
+async def scroll(count: int, lightweight: bool, app: App) -> Metrics:
+    rows = [_row(index) for index in range(count)]
+    list_view = await _docked(app, ListViewUo(rows, lightweight=lightweight))
+    window = list_view.window
+    steps = 100
+    span = max(1, int(list_view.max_scroll_y))
+    start = perf_counter()
+    for step in range(steps):
+        y = (step * 37) % span
+        list_view.y = list_view.target_y = y
+        while True:
+            _, arrangement_scroll, _ = window._cached_arrangement
+            if arrangement_scroll.y == y:
+                break
+            await asyncio.sleep(0)
+    elapsed = perf_counter() - start
+    return {"steps_per_s": steps / elapsed}
+
+
+async def stream(count: int, app: App) -> Metrics:
+    async def rows():
+        for index in range(count):
+            yield Text(f"event {index}")
+
+    start = perf_counter()
+    list_view = await _docked(
+        app, ListViewUo.stream(rows(), max_items=1000, batch_size=500, fps=60)
+    )
+    while list_view._stream is not None:
+        await asyncio.sleep(0.01)
+    await wait_idle(app)
+    elapsed = perf_counter() - start
+    return {"rows_per_s": count / elapsed}
+
+
+for count in (100, 1000, 10000):
+    for lightweight in (False, True):
+        kind = "light" if lightweight else "widgets"
+        register(
+            f"list_view.add_remove[{count}-{kind}]",
+            partial(add_remove, count, lightweight),
+        )
+        register(f"list_view.scroll[{count}-{kind}]", partial(scroll, count, lightweight))
+register("list_view.stream[20000]", partial(stream, 20000))
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from functools import partial
+from itertools import cycle
+from time import perf_counter
+from typing import Dict, List
+
+from textual import events
+from textual.app import App
+from textual.geometry import Size
+from textual.views import GridView
+
+from ck_widgets.color import CustomColor
+from ck_widgets.widgets import (
+    FrameScheduler,
+    ValueBarChange,
+    ValueBarGroup,
+    ValueBarH,
+    ValueBarHistory,
+    ValueBarV,
+    shared_scheduler,
+)
+from ck_widgets.widgets.value_bar import _ValueBar
+
+from .harness import Metrics, allocations, per_call, register, wait_idle
+
+COLOR_MODES: Dict[str, dict] = {
+    "plain": {},
+    "gradient": {"color": CustomColor.gradient("red", "blue")},
+    "stops": {
+        "color": CustomColor.gradient_stops(["red", "yellow", "green"]),
+        "bg_color": CustomColor.gradient("rgb(20,20,20)", "rgb(60,60,90)"),
+    },
+}
+
+
+def _bar(vertical: bool, cells: int, mode: str, **kwargs) -> _ValueBar:
+    if vertical:
+        bar: _ValueBar = ValueBarV(
+            max_value=cells, width=6, scheduler=None, **COLOR_MODES[mode], **kwargs
+        )
+    else:
+        bar = ValueBarH(
+            max_value=cells, height=3, scheduler=None, **COLOR_MODES[mode], **kwargs
+        )
+    # Not mounted, rendered straight to the app console
+    bar._size = Size(bar.width, bar.height)
+    return bar
+
+
+async def render(vertical: bool, cells: int, mode: str, app: App) -> Metrics:
+    bar = _bar(vertical, cells, mode)
+
+    def full() -> None:
+        bar._lines = None
+        bar.row_cache.cache_clear()
+        bar.render_lines()
+
+    levels = random.Random(0).choices(range(cells + 1), k=500)
+    steps = cycle(levels)
+
+    def step() -> None:
+        bar.fill = next(steps)
+        bar.render_lines()
+
+    for level in range(cells + 1):
+        bar.fill = level
+        bar.render_lines()
+    return {
+        "full_us": per_call(full, 50) * 1e6,
+        "update_us": per_call(step, 2000) * 1e6,
+        **{f"full_{key}": value for key, value in allocations(full, 20).items()},
+        **{f"update_{key}": value for key, value in allocations(step, 200).items()},
+    }
+
+
+async def render_eighths(cells: int, app: App) -> Metrics:
+    bar = _bar(False, cells, "gradient", high_resolution=True, value_range=(0, 1))
+    rnd = random.Random(0)
+    values = [rnd.random() for _ in range(500)]
+    for level in range(cells * 8 + 1):
+        bar.update(level / (cells * 8))
+        bar.render_lines()
+    steps = cycle(values)
+
+    def step() -> None:
+        bar.update(next(steps))
+        bar.render_lines()
+
+    return {"update_us": per_call(step, 2000) * 1e6, **allocations(step, 200)}
+
+
+async def history(samples: int, app: App) -> Metrics:
+    bar = ValueBarHistory(
+        samples=samples, max_value=10, value_range=(0, 1), high_resolution=True
+    )
+    bar.scheduler = None
+    bar._size = Size(bar.width, bar.height)
+    rnd = random.Random(0)
+    for _ in range(samples):
+        bar.push(rnd.random())
+    bar.render_lines()
+
+    def step() -> None:
+        bar.push(rnd.random())
+        bar.render_lines()
+
+    return {"push_render_us": per_call(step, 500) * 1e6}
+
+
+def _mouse(cls, app: App, x: int) -> events.MouseEvent:
+    # Sent to the app like the driver does, the view forwards it to the bar
+    return cls(app, x, 1, 0, 0, 1, False, False, False, screen_x=x, screen_y=1)
+
+
+async def drag(policy: str, app: App) -> Metrics:
+    bar = ValueBarH(max_value=100, height=3, emit_policy=policy)
+    await app.view.dock(bar, edge="top", size=3)
+    await wait_idle(app)
+    sent: List[object] = []
+    emit = bar.emit
+
+    async def counting_emit(message) -> bool:
+        if isinstance(message, ValueBarChange):
+            sent.append(message)
+        return await emit(message)
+
+    bar.emit = counting_emit  # type: ignore
+    moves = [abs(100 - step % 200) for step in range(1000)]
+    start = perf_counter()
+    app.post_message_no_wait(_mouse(events.MouseDown, app, 1))
+    for x in moves:
+        app.post_message_no_wait(_mouse(events.MouseMove, app, x + 1))
+        if x % 50 == 0:
+            await asyncio.sleep(0)
+    app.post_message_no_wait(_mouse(events.MouseUp, app, moves[-1] + 1))
+    await wait_idle(app)
+    elapsed = perf_counter() - start
+    return {
+        "drag_ms": elapsed * 1e3,
+        "events": len(moves) + 2,
+        "messages": len(sent),
+    }
+
+
+async def scheduler(bars: int, app: App) -> Metrics:
+    widgets = [ValueBarH(max_value=40) for _ in range(bars)]
+
+    class Grid(GridView):
+        async def on_mount(self) -> None:
+            self.grid.add_column("col", repeat=4)
+            self.grid.add_row("row", repeat=-(-bars // 4), size=3)
+            self.grid.place(*widgets)
+
+    await app.view.dock(Grid())
+    await wait_idle(app)
+    rnd = random.Random(0)
+    frames = shared_scheduler.frames
+    ticks = 0
+    start = perf_counter()
+    while perf_counter() - start < 1.0:
+        for bar in widgets:
+            bar.fill = rnd.randrange(41)
+        ticks += 1
+        await asyncio.sleep(0.002)
+    elapsed = perf_counter() - start
+    return {
+        "ticks_per_s": ticks / elapsed,
+        "frames_per_s": (shared_scheduler.frames - frames) / elapsed,
+    }
+
+
+async def group(bars: int, rate: float, app: App) -> Metrics:
+    """Feed of `bars` values `rate` times per second for one second"""
+    frame_scheduler = FrameScheduler()
+    value_bars = [ValueBarH(max_value=20, value_range=(0, 1)) for _ in range(bars)]
+    bar_group = ValueBarGroup(
+        value_bars, columns=8, row_size=3, scheduler=frame_scheduler
+    )
+    await app.view.dock(bar_group)
+    await wait_idle(app)
+    rnd = random.Random(0)
+    frames, repaints = frame_scheduler.frames, frame_scheduler.repaints
+    ticks = int(rate)
+    busy = lag = 0.0
+    start = perf_counter()
+    for tick in range(ticks):
+        due = start + tick / rate
+        await asyncio.sleep(max(0.0, due - perf_counter()))
+        lag = max(lag, perf_counter() - due)
+        tick_start = perf_counter()
+        await bar_group.set_values([rnd.random() for _ in range(bars)])
+        busy += perf_counter() - tick_start
+    await wait_idle(app)
+    elapsed = perf_counter() - start
+    frames = frame_scheduler.frames - frames
+    return {
+        "set_values_us": busy / ticks * 1e6,
+        "max_lag_ms": lag * 1e3,
+        "frames_per_s": frames / elapsed,
+        "repaints_per_frame": (frame_scheduler.repaints - repaints) / max(frames, 1),
+    }
+
+
+for vertical, sizes in ((False, (20, 80, 200)), (True, (10, 40))):
+    for cells in sizes:
+        for mode in COLOR_MODES:
+            name = f"value_bar.render[{'V' if vertical else 'H'}-{cells}-{mode}]"
+            register(name, partial(render, vertical, cells, mode))
+register("value_bar.render_eighths[H-80]", partial(render_eighths, 80))
+register("value_bar.history[120]", partial(history, 120))
+for policy in ("always", "change", "throttle", "debounce", "coalesce"):
+    register(f"value_bar.drag[{policy}]", partial(drag, policy))
+register("value_bar.scheduler[48]", partial(scheduler, 48))
+register("value_bar.group[200@30Hz]", partial(group, 200, 30.0))
@@ -1 +1,10 @@
-from .color_tools import CColor, create_gradient, CustomColor
+from .color_tools import (
+    CColor,
+    ColorPalette,
+    ColorSpec,
+    create_gradient,
+    gradient_palette,
+    gradient_triplets,
+    CustomColor,
+    parse_color,
+)
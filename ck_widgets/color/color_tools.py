@@ -1,11 +1,45 @@
 from rich.color import Color, blend_rgb
-from typing import List, Union
-from functools import lru_cache
+from collections import OrderedDict
+from itertools import count
+from typing import Hashable, List, Optional, Sequence, Union
 
 from rich.color_triplet import ColorTriplet
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 CColor = Union[Color, str]
 
+_interned_keys: "OrderedDict[Hashable, int]" = OrderedDict()
+_next_interned = count()
+MAX_INTERNED_KEYS = 1024
+
+
+def parse_color(color: Optional[CColor]) -> Optional[Color]:
+    """Color of a color string, `Color.parse` caches recently parsed ones"""
+    if not isinstance(color, str):
+        return color
+    return Color.parse(color)
+
+
+def intern_key(key: Hashable) -> int:
+    """Small int standing for key, cheap to hash in cache keys
+
+    Only the `MAX_INTERNED_KEYS` last used keys are kept. Numbers are
+    never reused, so an evicted key gets a new one and cache entries
+    made with the old number are just not hit again.
+    """
+    number = _interned_keys.get(key)
+    if number is None:
+        number = _interned_keys[key] = next(_next_interned)
+        if len(_interned_keys) > MAX_INTERNED_KEYS:
+            _interned_keys.popitem(last=False)
+    else:
+        _interned_keys.move_to_end(key)
+    return number
+
 
 def ccolor_to_color_triplet(color: CColor) -> ColorTriplet:
     if isinstance(color, str):
@@ -16,39 +50,110 @@ def ccolor_to_color_triplet(color: CColor) -> ColorTriplet:
     return tri
 
 
-def create_gradient(color_a: CColor, color_b: CColor, n) -> List[CColor]:
-    a = ccolor_to_color_triplet(color_a)
-    b = ccolor_to_color_triplet(color_b)
+def _gradient_python(stops: List[ColorTriplet], n: int) -> List[ColorTriplet]:
+    segments = len(stops) - 1
+    ramp = []
+    for x in range(n):
+        position = x / n * segments
+        i = min(int(position), segments - 1)
+        ramp.append(blend_rgb(stops[i], stops[i + 1], position - i))
+    return ramp
+
 
-    return [Color.from_triplet(blend_rgb(a, b, x / n)) for x in range(n)]
+def _gradient_numpy(stops: List[ColorTriplet], n: int) -> List[ColorTriplet]:
+    segments = len(stops) - 1
+    position = numpy.arange(n) / n * segments
+    i = numpy.minimum(position.astype(int), segments - 1)
+    cross_fade = (position - i)[:, None]
+    start = numpy.array(stops)[i]
+    end = numpy.array(stops)[i + 1]
+    ramp = (start + (end - start) * cross_fade).astype(int)
+    return [ColorTriplet(*rgb) for rgb in ramp.tolist()]
+
+
+def gradient_triplets(colors: Sequence[CColor], n: int) -> List[ColorTriplet]:
+    """Ramp of n colors going through evenly spaced stops
+
+    Computed in one array operation when NumPy is installed.
+    Gives the same values as chaining `blend_rgb`.
+    """
+    stops = [ccolor_to_color_triplet(color) for color in colors]
+    if n <= 0 or not stops:
+        return []
+    if len(stops) == 1:
+        return stops * n
+    if numpy is not None:
+        return _gradient_numpy(stops, n)
+    return _gradient_python(stops, n)
+
+
+def gradient_palette(colors: Sequence[CColor], n: int) -> List[Color]:
+    return [Color.from_triplet(triplet) for triplet in gradient_triplets(colors, n)]
+
+
+def create_gradient(color_a: CColor, color_b: CColor, n) -> List[CColor]:
+    return gradient_palette([color_a, color_b], n)
 
 
 class CustomColor:
     __auto_size: bool = False
+    max_palettes: int = 8
 
     def __init__(self, color_list: List[CColor], repeat=True):
         self.color_list = color_list
         self.repeat = repeat
+        self.version = 0
+        self._palettes: OrderedDict[int, List[CColor]] = OrderedDict()
 
     def __getitem__(self, index: int):
         return self.color_list[index]
 
     def __setitem__(self, index: int, value: CColor):
         self.color_list[index] = value
+        self.version += 1
+        self.clear_cache()
 
     def __get__(self, instance, owner):
         return self.color_list
 
-    @lru_cache
+    @property
+    def key(self) -> Hashable:
+        return (tuple(self.color_list), self.repeat, self.__auto_size)
+
+    def clear_cache(self) -> None:
+        self._palettes.clear()
+
+    def palette(self, size: int) -> List[CColor]:
+        """Colors for positions 0..size-1, ready to be indexed directly
+
+        Palettes of the last `max_palettes` sizes are kept
+        until a color is set or `clear_cache` is called.
+        """
+        palettes = self._palettes
+        colors = palettes.get(size)
+        if colors is not None:
+            palettes.move_to_end(size)
+            return colors
+        if self.__auto_size:
+            colors = gradient_palette(self.color_list, size)
+        elif self.repeat:
+            n = len(self.color_list)
+            colors = [self.color_list[i % n] for i in range(size)]
+        else:
+            last = len(self.color_list) - 1
+            colors = [self.color_list[min(i, last)] for i in range(size)]
+        palettes[size] = colors
+        if len(palettes) > self.max_palettes:
+            palettes.popitem(last=False)
+        return colors
+
     def get_color(self, index, max_size: Union[int, None] = None):
-        if self.__auto_size and len(self.color_list) == 2:
-            a, b = self.color_list
-            a, b = ccolor_to_color_triplet(a), ccolor_to_color_triplet(b)
-            return Color.from_triplet(blend_rgb(a, b, index / max_size))
+        if self.__auto_size:
+            return self.palette(max_size)[index]
         if self.repeat:
             return self.color_list[index % len(self.color_list)]
         else:
-            mx = max(index, len(self.color_list))
+            mx = min(index, len(self.color_list) - 1)
             return self.color_list[mx]
 
     @classmethod
@@ -59,14 +164,85 @@ class CustomColor:
         n: Union[int, None] = None,
         repeat: bool = True,
     ) -> "CustomColor":
+        return cls.gradient_stops([color_a, color_b], n, repeat=repeat)
+
+    @classmethod
+    def gradient_stops(
+        cls,
+        colors: List[CColor],
+        n: Union[int, None] = None,
+        repeat: bool = True,
+    ) -> "CustomColor":
+        """Gradient going through all `colors`
+
+        Without `n` it is stretched to the size of the widget using it.
+        """
 
         if n is None:
             auto_size = True
-            color_list: List[CColor] = [color_a, color_b]
+            color_list: List[CColor] = list(colors)
         else:
             auto_size = False
-            color_list: List[CColor] = create_gradient(color_a, color_b, n)
+            color_list: List[CColor] = gradient_palette(colors, n)
 
         new_obj = cls(color_list, repeat=repeat)
         new_obj.__auto_size = auto_size
         return new_obj
+
+
+ColorSpec = Union[CColor, List[CColor], CustomColor, None]
+
+
+class ColorPalette:
+    """Any color spec parsed once and indexed by position
+
+    Lists are parsed when the palette is created, so changes
+    to a list after that are not seen. `CustomColor` is followed
+    through its `version`.
+    """
+
+    max_sizes: int = 4
+
+    def __init__(self, color: ColorSpec) -> None:
+        self.source = color
+        self._sizes: OrderedDict[int, List[Optional[Color]]] = OrderedDict()
+        self._parse()
+
+    def _parse(self) -> None:
+        color = self.source
+        self._sizes.clear()
+        if isinstance(color, CustomColor):
+            self._version = color.version
+            self._colors: Optional[List[Optional[Color]]] = None
+            self._key = intern_key(color.key)
+        else:
+            colors = color if isinstance(color, list) else [color]
+            self._colors = [parse_color(c) for c in colors]
+            self._key = intern_key(tuple(self._colors))
+
+    def _check_version(self) -> None:
+        color = self.source
+        if isinstance(color, CustomColor) and color.version != self._version:
+            self._parse()
+
+    @property
+    def key(self) -> int:
+        self._check_version()
+        return self._key
+
+    def colors(self, size: int) -> List[Optional[Color]]:
+        self._check_version()
+        sizes = self._sizes
+        colors = sizes.get(size)
+        if colors is not None:
+            return colors
+        if self._colors is None:
+            assert isinstance(self.source, CustomColor)
+            colors = [parse_color(c) for c in self.source.palette(size)]
+        else:
+            n = len(self._colors)
+            colors = [self._colors[i % n] for i in range(size)]
+        sizes[size] = colors
+        if len(sizes) > self.max_sizes:
+            sizes.popitem(last=False)
+        return colors
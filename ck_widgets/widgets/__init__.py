@@ -1,3 +1,8 @@
 from .debug_window import DebugWindow, DebugStatus
-from .value_bar import ValueBarV, ValueBarH, ValueBarChange
+from .value_bar import ValueBarV, ValueBarH, ValueBarHistory, ValueBarChange
 from .list_view import ListViewUo
+from .list_order import ListOrder
+from .row_cache import RowCache
+from .frame_scheduler import FrameScheduler, shared_scheduler
+from .value_bar_group import ValueBarGroup, ValueBarGroupChange
+from .instrumentation import instrumentation, Instrumentation, RenderStat
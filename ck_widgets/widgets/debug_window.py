@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import sys
-from rich.console import RenderableType
+from collections import deque
+from itertools import islice
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
 from rich.segment import Segment
 import textual
+from textual import events
 from textual.reactive import Reactive
 from textual.widget import Widget
 
@@ -14,6 +21,9 @@ from rich.pretty import Pretty
 from rich.text import Text
 from textual.message import Message
 
+from .frame_scheduler import ScheduledRefresh
+from .instrumentation import instrumentation, instrumented
+
 
 class DebugStatus(Message):
     def __init__(self, sender: Widget, mes: str):
@@ -21,18 +31,228 @@ class DebugStatus(Message):
         self.mes = mes
 
 
-class DebugWindow(Widget):
+def _text(message: RenderableType) -> Text:
+    if isinstance(message, Text):
+        return message
+    return Text.from_markup(str(message))
+
+
+class _StatusEntry:
+    __slots__ = ("value", "line", "updated", "_width", "_segments")
+
+    def __init__(self, key: str, value: RenderableType, updated: float) -> None:
+        self.value = value
+        self.updated = updated
+        line = Text.assemble(
+            (key, "bold"), ": ", _text(value), no_wrap=True, overflow="ellipsis"
+        )
+        if "\n" in line.plain:
+            line = Text(" ", no_wrap=True, overflow="ellipsis").join(line.split("\n"))
+        self.line = line
+        self._width = -1
+        self._segments: List[Segment] = []
+
+    def segments(self, console: Console, options: ConsoleOptions) -> List[Segment]:
+        """Rendered line, cached until the width changes"""
+        width = options.max_width
+        if width != self._width:
+            options = options.update(width=width, height=None)
+            self._segments = console.render_lines(self.line, options, pad=False)[0]
+            self._width = width
+        return self._segments
+
+
+class _Rows:
+    """Cached status lines followed by the log"""
+
+    def __init__(self, status: List[_StatusEntry], log: Text) -> None:
+        self.status = status
+        self.log = log
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        new_line = Segment.line()
+        for index, entry in enumerate(self.status):
+            if index:
+                yield new_line
+            yield from entry.segments(console, options)
+        if self.log:
+            if self.status:
+                yield new_line
+            yield self.log
+
+
+class DebugWindow(ScheduledRefresh, Widget):
+    """Panel with status entries above a bounded log
+
+    `write_line` and `set_status` only store the line, repaints are
+    coalesced by the scheduler. Only the newest log lines fitting the
+    window are rendered, older than `max_lines` are dropped. `debug` is
+    shown above both.
+
+    Status lines are rendered once per change of their value and kept
+    in `status_order` of their keys, insertion order by default. Keys
+    not set for `status_ttl` seconds are removed. `status_interval`
+    limits repaints caused by status changes to one per interval.
+    """
+
     last_info: Reactive = Reactive("")
     debug: Reactive = Reactive("")
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        max_lines: int = 1000,
+        status_order: Optional[Callable[[str], Any]] = None,
+        status_ttl: Optional[float] = None,
+        status_interval: float = 0.0,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
+        self._stats_top = 10
+        self._lines: Deque[Text] = deque(maxlen=max_lines)
+        self._debug_height: Dict[int, int] = {}
+        self.status_order = status_order
+        self.status_ttl = status_ttl
+        self.status_interval = status_interval
+        self._status: Dict[str, _StatusEntry] = {}
+        # Keys from the least recently set, for expiry
+        self._touched: Dict[str, None] = {}
+        self._order: Optional[List[str]] = None
+        self._status_handle: Optional[asyncio.TimerHandle] = None
+        self._status_refreshed = 0.0
+
+    async def on_mount(self, event: events.Mount) -> None:
+        if self.status_ttl:
+            self.set_interval(self.status_ttl / 4, callback=self.expire_status)
+
+    def write_line(self, *messages: RenderableType, sep: str = " ") -> None:
+        """Append a line, strings are console markup"""
+        text = Text(sep).join(_text(message) for message in messages)
+        if "\n" in text.plain:
+            self._lines.extend(text.split("\n"))
+        else:
+            self._lines.append(text)
+        self.refresh()
+
+    def set_status(self, key: str, value: RenderableType) -> None:
+        """Show `key: value` line above the log, replaces previous `key`"""
+        now = monotonic()
+        entry = self._status.get(key)
+        self._touched.pop(key, None)
+        self._touched[key] = None
+        if entry is not None and entry.value == value:
+            entry.updated = now
+            return
+        if entry is None:
+            self._order = None
+        self._status[key] = _StatusEntry(key, value, now)
+        self._status_changed()
+
+    def remove_status(self, *keys: str) -> None:
+        removed = False
+        for key in keys:
+            if self._status.pop(key, None) is not None:
+                del self._touched[key]
+                removed = True
+        if removed:
+            self._order = None
+            self._status_changed()
+
+    @property
+    def status(self) -> Dict[str, RenderableType]:
+        return {key: self._status[key].value for key in self._status_keys()}
+
+    def expire_status(self) -> None:
+        """Remove keys not set for `status_ttl` seconds"""
+        if not self.status_ttl:
+            return
+        deadline = monotonic() - self.status_ttl
+        expired = []
+        for key in self._touched:
+            if self._status[key].updated > deadline:
+                break
+            expired.append(key)
+        self.remove_status(*expired)
+
+    def _status_changed(self) -> None:
+        if not self.status_interval:
+            self.refresh()
+            return
+        if self._status_handle is not None:
+            return
+        delay = self._status_refreshed + self.status_interval - monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            delay = 0
+        if delay > 0:
+            self._status_handle = loop.call_later(delay, self._refresh_status)
+        else:
+            self._refresh_status()
+
+    def _refresh_status(self) -> None:
+        self._status_handle = None
+        self._status_refreshed = monotonic()
+        if not (self._closing or self._closed):
+            self.refresh()
+
+    def _status_keys(self) -> Iterable[str]:
+        if self._order is None:
+            keys = list(self._status)
+            if self.status_order is not None:
+                keys.sort(key=self.status_order)
+            self._order = keys
+        return self._order
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self._status.clear()
+        self._touched.clear()
+        self._order = None
+        self.refresh()
+
+    def watch_debug(self, _: RenderableType) -> None:
+        self._debug_height.clear()
+
+    def _measure_debug(self, width: int) -> int:
+        height = self._debug_height.get(width)
+        if height is None:
+            options = self.app.console.options.update_width(width)
+            height = len(self.app.console.render_lines(self.debug, options, pad=False))
+            self._debug_height[width] = height
+        return height
+
+    def _visible_rows(self) -> _Rows:
+        width, height = self.size
+        # Inside the panel borders
+        width, height = width - 4, height - 2
+        if self.debug:
+            height -= self._measure_debug(width)
+        height = max(0, height)
+        status = [self._status[key] for key in islice(self._status_keys(), height)]
+        log = list(islice(reversed(self._lines), height - len(status)))
+        log.reverse()
+        return _Rows(status, Text("\n", no_wrap=True, overflow="ellipsis").join(log))
+
+    def show_stats(self, interval: float = 1.0, top: int = 10) -> None:
+        """Enable instrumentation and show its report every `interval` seconds"""
+        instrumentation.enable()
+        self._stats_top = top
+        self.set_interval(interval, callback=self._show_stats)
+
+    def _show_stats(self) -> None:
+        self.debug = instrumentation.report(self._stats_top)
 
+    @instrumented(cells=lambda window, _: window.size.area)
     def render(self) -> RenderableType:
         # OverflowMethod = Literal["fold", "crop", "ellipsis", "ignore"]
+        rows = self._visible_rows()
+        body: RenderableType = rows
+        if self.debug:
+            body = Group(self.debug, rows) if rows.status or rows.log else self.debug
 
         return Panel(
-            self.debug,
+            body,
             title="Debug Window",
             style="yellow",
             box=box.HEAVY,
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+from textual._context import active_app
+from textual.widget import Widget
+
+
+class FrameScheduler:
+    """Coalesces repaints of many widgets into frames
+
+    Widgets ask for a repaint with `request_repaint`, all of them are
+    repainted together at the end of the frame, each at most once. When
+    more than one widget changed, the screen is drawn once instead of
+    once per widget. There are at most `fps` frames per second, a request
+    after a quiet period is flushed on the next loop iteration. `fps=0`
+    removes the cap.
+    """
+
+    def __init__(self, fps: float = 60.0) -> None:
+        self.fps = fps
+        self.requests = 0
+        self.repaints = 0
+        self.frames = 0
+        self._repaints: Dict[ScheduledRefresh, None] = {}
+        self._callbacks: Dict[Hashable, Callable[[], None]] = {}
+        self._handle: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flushed_at = 0.0
+
+    def _schedule(self) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._handle is not None and self._loop is loop:
+            return True
+        self._loop = loop
+        delay = self._flushed_at + 1 / self.fps - monotonic() if self.fps else 0
+        if delay > 0:
+            self._handle = loop.call_later(delay, self.flush)
+        else:
+            self._handle = loop.call_soon(self.flush)
+        return True
+
+    def request(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """Call `callback` at the end of the frame, once per `key`"""
+        self.requests += 1
+        if self._schedule():
+            self._callbacks[key] = callback
+        else:
+            callback()
+
+    def request_repaint(self, widget: ScheduledRefresh) -> None:
+        self.requests += 1
+        if self._schedule():
+            self._repaints[widget] = None
+        else:
+            widget.refresh_now()
+
+    def flush(self) -> None:
+        """Run all pending callbacks and repaints now"""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._flushed_at = monotonic()
+        callbacks, self._callbacks = self._callbacks, {}
+        repaints, self._repaints = self._repaints, {}
+        if callbacks or repaints:
+            self.frames += 1
+        for key, callback in callbacks.items():
+            if isinstance(key, Widget) and (key._closing or key._closed):
+                continue
+            callback()
+
+        self.repaints += repaint_widgets(repaints)
+
+
+def repaint_widgets(widgets: Iterable[Widget]) -> int:
+    """Repaint `widgets` with at most one screen draw, returns their count"""
+    widgets = [widget for widget in widgets if not (widget._closing or widget._closed)]
+    if len(widgets) == 1:
+        widget = widgets[0]
+        if isinstance(widget, ScheduledRefresh):
+            widget.refresh_now()
+        else:
+            widget.refresh()
+    elif widgets:
+        # Each widget update draws the whole screen, so draw it once
+        for widget in widgets:
+            widget.clear_render_cache()
+        active_app.get().refresh()
+    return len(widgets)
+
+
+shared_scheduler = FrameScheduler()
+
+
+class ScheduledRefresh:
+    """Widget mixin which repaints through a `FrameScheduler`
+
+    Layout refreshes are not delayed. Set `scheduler` to None to repaint
+    right away.
+    """
+
+    scheduler: Optional[FrameScheduler] = shared_scheduler
+
+    def refresh(self, repaint: bool = True, layout: bool = False) -> None:
+        scheduler = self.scheduler
+        if layout or not repaint or scheduler is None:
+            super().refresh(repaint, layout)  # type: ignore
+        else:
+            scheduler.request_repaint(self)
+
+    def refresh_now(self) -> None:
+        super().refresh()  # type: ignore
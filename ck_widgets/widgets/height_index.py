@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class HeightIndex:
+    """Item heights with offsets and lookup by offset in O(log n)
+
+    Fenwick tree over item heights, each followed by `gap` lines. Unknown
+    (negative) heights count as zero. Changing a height, appending and
+    dropping items from the front are O(log n). Other inserts and removals
+    drop the tree, it is rebuilt in O(n) on next lookup.
+    """
+
+    def __init__(self, heights: Iterable[int] = (), gap: int = 0) -> None:
+        self.gap = gap
+        self._heights: List[int] = list(heights)
+        self._tree: List[int] | None = None
+        self._head = 0
+
+    def _slot(self, height: int) -> int:
+        return max(height, 0) + self.gap
+
+    def _build(self) -> List[int]:
+        if self._head:
+            del self._heights[: self._head]
+            self._head = 0
+        heights = self._heights
+        size = len(heights)
+        tree = [0] * (size + 1)
+        slot = self._slot
+        for position, height in enumerate(heights, 1):
+            tree[position] += slot(height)
+            parent = position + (position & -position)
+            if parent <= size:
+                tree[parent] += tree[position]
+        self._tree = tree
+        return tree
+
+    def _get_tree(self) -> List[int]:
+        tree = self._tree
+        return self._build() if tree is None else tree
+
+    def _add(self, position: int, delta: int) -> None:
+        tree = self._tree
+        if tree is None:
+            return
+        size = len(tree)
+        position += 1
+        while position < size:
+            tree[position] += delta
+            position += position & -position
+
+    def _prefix(self, position: int) -> int:
+        tree = self._get_tree()
+        total = 0
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def __len__(self) -> int:
+        return len(self._heights) - self._head
+
+    def __iter__(self) -> Iterator[int]:
+        return islice(self._heights, self._head, None)
+
+    def _position(self, index: int) -> int:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("height index out of range")
+        return self._head + index
+
+    def __getitem__(self, index: int) -> int:
+        return self._heights[self._position(index)]
+
+    def __setitem__(self, index: int, height: int) -> None:
+        position = self._position(index)
+        old = self._heights[position]
+        self._heights[position] = height
+        delta = self._slot(height) - self._slot(old)
+        if delta:
+            self._add(position, delta)
+
+    def update(self, changes: Sequence[Tuple[int, int]]) -> None:
+        """Set many `(index, height)` at once, rebuilds if that is cheaper"""
+        if self._tree is not None and len(changes) * 8 < len(self):
+            for index, height in changes:
+                self[index] = height
+            return
+        heights = self._heights
+        head = self._head
+        for index, height in changes:
+            heights[head + index] = height
+        self._tree = None
+
+    def append(self, height: int) -> None:
+        heights = self._heights
+        tree = self._tree
+        heights.append(height)
+        if tree is None:
+            return
+        position = len(heights)
+        # Node covers (position - lowbit, position], sum of others is known
+        low = position - (position & -position)
+        tree.append(self._slot(height) + self._prefix(position - 1) - self._prefix(low))
+
+    def extend(self, heights: Iterable[int]) -> None:
+        for height in heights:
+            self.append(height)
+
+    def splice(self, start: int, end: int, heights: Sequence[int] = ()) -> List[int]:
+        """Replace heights in `start:end` with `heights`, returns removed ones"""
+        count = len(self)
+        head = self._head
+        removed = self._heights[head + start : head + end]
+        if start == end == count:
+            self.extend(heights)
+        elif start == 0 and not heights:
+            self._drop_front(end)
+        else:
+            self._heights[head + start : head + end] = heights
+            self._tree = None
+        return removed
+
+    def _drop_front(self, count: int) -> None:
+        # Dropped heights stay as zeros until they outnumber live ones
+        for position in range(self._head, self._head + count):
+            self._add(position, -self._slot(self._heights[position]))
+        self._head += count
+        if self._head > len(self):
+            del self._heights[: self._head]
+            self._head = 0
+            self._tree = None
+
+    def offset(self, index: int) -> int:
+        """Lines above item at `index`, `len(self)` gives total"""
+        self._get_tree()
+        return self._prefix(self._head + min(max(index, 0), len(self)))
+
+    @property
+    def total(self) -> int:
+        self._get_tree()
+        return self._prefix(len(self._heights))
+
+    def index_at(self, y: int) -> Optional[int]:
+        """Index of item which (with its gap) covers line `y`"""
+        if y < 0:
+            return None
+        tree = self._get_tree()
+        size = len(tree) - 1
+        position = 0
+        step = 1 << size.bit_length()
+        while step:
+            following = position + step
+            if following <= size and tree[following] <= y:
+                position = following
+                y -= tree[following]
+            step >>= 1
+        if position >= size:
+            return None
+        return position - self._head
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from rich.table import Table
+
+Cells = Callable[[Any, Any], int]
+
+
+class RenderStat(NamedTuple):
+    calls: int
+    total: float
+    p50: float
+    p99: float
+    cells: int
+    styles: int
+
+
+class _Record:
+    __slots__ = ("calls", "total", "durations", "cells", "styles")
+
+    def __init__(self, samples: int) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.durations: Deque[float] = deque(maxlen=samples)
+        self.cells = 0
+        self.styles = 0
+
+    def stat(self) -> RenderStat:
+        durations = sorted(self.durations)
+        count = len(durations)
+        return RenderStat(
+            self.calls,
+            self.total,
+            durations[count // 2] if count else 0.0,
+            durations[min(count * 99 // 100, count - 1)] if count else 0.0,
+            self.cells,
+            self.styles,
+        )
+
+
+class Instrumentation:
+    """Opt-in timing of widget render and arrange methods
+
+    Disabled it costs one attribute check per call. Enabled it records
+    calls, durations, rendered cells and styles created for each widget
+    and method, nested calls are counted in both. Styles are counted as
+    misses of `lru_cache` style factories registered with `count_styles`.
+
+    ```python
+    instrumentation.enable()
+    ...
+    for (widget, method), stat in instrumentation.stats().items():
+        print(widget, method, stat.p99)
+    ```
+    """
+
+    def __init__(self, samples: int = 512) -> None:
+        self.enabled = False
+        self.samples = samples
+        self._style_factories: List[Callable] = []
+        self._records: Dict[Tuple[str, str], _Record] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def count_styles(self, *factories: Callable) -> None:
+        """Count cache misses of `lru_cache` decorated `factories` as styles"""
+        self._style_factories.extend(factories)
+
+    @property
+    def styles_created(self) -> int:
+        return sum(factory.cache_info().misses for factory in self._style_factories)
+
+    def reset(self) -> None:
+        self._records.clear()
+
+    def record(
+        self, widget: str, method: str, duration: float, cells: int, styles: int
+    ) -> None:
+        key = (widget, method)
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = _Record(self.samples)
+        record.calls += 1
+        record.total += duration
+        record.durations.append(duration)
+        record.cells += cells
+        record.styles += styles
+
+    def stats(self) -> Dict[Tuple[str, str], RenderStat]:
+        """Stats by `(widget name, method)`, durations in seconds"""
+        return {key: record.stat() for key, record in self._records.items()}
+
+    def report(self, top: int = 10) -> Table:
+        """Table of `top` widget methods with most total time"""
+        table = Table(
+            "widget",
+            "method",
+            "calls",
+            "total ms",
+            "p50 us",
+            "p99 us",
+            "cells",
+            "styles",
+            box=None,
+        )
+        stats = sorted(self.stats().items(), key=lambda item: -item[1].total)
+        for (widget, method), stat in stats[:top]:
+            table.add_row(
+                widget,
+                method,
+                str(stat.calls),
+                f"{stat.total * 1e3:.1f}",
+                f"{stat.p50 * 1e6:.0f}",
+                f"{stat.p99 * 1e6:.0f}",
+                str(stat.cells),
+                str(stat.styles),
+            )
+        return table
+
+
+instrumentation = Instrumentation()
+
+
+def _name(obj: Any) -> str:
+    return getattr(obj, "name", None) or type(obj).__name__
+
+
+def instrumented(cells: Optional[Cells] = None) -> Callable:
+    """Record calls of the decorated method in `instrumentation`
+
+    Args:
+        cells: Cells rendered by a call, from the object and the result
+    """
+
+    def decorator(method: Callable) -> Callable:
+        name = method.__name__
+
+        if iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                if not instrumentation.enabled:
+                    return await method(self, *args, **kwargs)
+                styles = instrumentation.styles_created
+                start = perf_counter()
+                result = await method(self, *args, **kwargs)
+                instrumentation.record(
+                    _name(self),
+                    name,
+                    perf_counter() - start,
+                    cells(self, result) if cells else 0,
+                    instrumentation.styles_created - styles,
+                )
+                return result
+
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not instrumentation.enabled:
+                return method(self, *args, **kwargs)
+            styles = instrumentation.styles_created
+            start = perf_counter()
+            result = method(self, *args, **kwargs)
+            instrumentation.record(
+                _name(self),
+                name,
+                perf_counter() - start,
+                cells(self, result) if cells else 0,
+                instrumentation.styles_created - styles,
+            )
+            return result
+
+        return wrapper
+
+    return decorator
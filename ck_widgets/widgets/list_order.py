@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from .list_view import Item, ListViewUo
+
+Key = Callable[[Any], Any]
+Predicate = Callable[[Any], bool]
+
+
+class ListOrder:
+    """Sorted and filtered view of items shown in ListViewUo
+
+    Shown items are kept ordered by `key` (order of adding by default).
+    Adding or removing one item finds its row with bisect over kept keys
+    and changes only that row of the list. While it is used, the list
+    should only be changed through this object.
+
+    ```python
+    order = ListOrder(list_view, key=lambda task: task.priority)
+    await order.set_items(tasks)
+    await order.add(task)
+    await order.set_filter(lambda task: not task.done)
+    ```
+    """
+
+    def __init__(
+        self,
+        list_view: ListViewUo,
+        *,
+        key: Key | None = None,
+        where: Predicate | None = None,
+        reverse: bool = False,
+    ) -> None:
+        from .list_view import MultipleWidgetsWindowView
+
+        window = list_view.window
+        if not isinstance(window, MultipleWidgetsWindowView) or window.max_items:
+            raise ValueError("ListOrder needs a ListViewUo without max_items")
+        self.list_view = list_view
+        self.key = key
+        self.where = where
+        self.reverse = reverse
+        self._items: Dict[int, Item] = {}
+        self._added: Dict[int, int] = {}
+        self._counter = count()
+        # Shown items and their keys in ascending key order
+        self._keys: List[Any] = []
+        self._shown: List[Item] = []
+        self._shown_keys: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._shown)
+
+    @property
+    def items(self) -> List[Item]:
+        """All items in order of adding, shown or not"""
+        return list(self._items.values())
+
+    @property
+    def shown(self) -> List[Item]:
+        """Items passing the filter, in order of the list"""
+        return self._shown[::-1] if self.reverse else list(self._shown)
+
+    def _key_of(self, item: Item) -> Any:
+        return self._added[id(item)] if self.key is None else self.key(item)
+
+    def _matches(self, item: Item) -> bool:
+        return self.where is None or self.where(item)
+
+    def _row(self, position: int) -> int:
+        return len(self._shown) - 1 - position if self.reverse else position
+
+    def _track(self, item: Item) -> None:
+        if id(item) in self._items:
+            raise ValueError(f"{item!r} is already in the list")
+        self._items[id(item)] = item
+        self._added[id(item)] = next(self._counter)
+
+    def _sort(self, items: List[Item]) -> List[int]:
+        """Keep `items` as shown ones, returns their order in the list"""
+        keys = [self._key_of(item) for item in items]
+        # Stable, rows with equal keys keep their order
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=self.reverse)
+        ascending = order[::-1] if self.reverse else order
+        self._keys = [keys[index] for index in ascending]
+        self._shown = [items[index] for index in ascending]
+        self._shown_keys = {
+            id(item): key for key, item in zip(self._keys, self._shown)
+        }
+        return order
+
+    def _find(self, item: Item) -> Optional[int]:
+        if id(item) not in self._shown_keys:
+            return None
+        key = self._shown_keys[id(item)]
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, start)
+        for position in range(start, end):
+            if self._shown[position] is item:
+                return position
+        return None
+
+    async def _insert(self, item: Item) -> None:
+        key = self._key_of(item)
+        keys = self._keys
+        if self.reverse:
+            # Leftmost in ascending order is last among equal rows
+            position = bisect_left(keys, key)
+            row = len(keys) - position
+        else:
+            position = row = bisect_right(keys, key)
+        keys.insert(position, key)
+        self._shown.insert(position, item)
+        self._shown_keys[id(item)] = key
+        await self.list_view.add_widget(item, row)
+
+    async def _hide(self, positions: Iterable[int]) -> None:
+        positions = sorted(set(positions), reverse=True)
+        if not positions:
+            return
+        rows = [self._row(position) for position in positions]
+        for position in positions:
+            del self._keys[position]
+            item = self._shown.pop(position)
+            del self._shown_keys[id(item)]
+        await self.list_view.remove_widgets(rows)
+
+    async def set_items(self, items: Iterable[Item]) -> None:
+        """Replace all items, they are sorted once"""
+        self._items.clear()
+        self._added.clear()
+        for item in items:
+            self._track(item)
+        shown = [item for item in self._items.values() if self._matches(item)]
+        self._sort(shown)
+        layout = self.list_view.window.layout
+        await self.list_view.replace_range(0, len(layout), self.shown)
+
+    async def add(self, item: Item) -> None:
+        self._track(item)
+        if self._matches(item):
+            await self._insert(item)
+
+    async def add_items(self, items: Iterable[Item]) -> None:
+        async with self.list_view.batch():
+            for item in items:
+                await self.add(item)
+
+    async def remove(self, item: Item) -> None:
+        if self._items.pop(id(item), None) is None:
+            return
+        del self._added[id(item)]
+        position = self._find(item)
+        if position is not None:
+            await self._hide([position])
+
+    async def refresh_item(self, item: Item) -> None:
+        """Move `item` to its row after its key or filter result changed"""
+        if id(item) not in self._items:
+            return
+        async with self.list_view.batch():
+            position = self._find(item)
+            if position is not None:
+                await self._hide([position])
+            if self._matches(item):
+                await self._insert(item)
+
+    async def set_filter(self, where: Predicate | None) -> None:
+        """Show items passing `where`, only rows with changed result move"""
+        self.where = where
+        async with self.list_view.batch():
+            await self._hide(
+                position
+                for position, item in enumerate(self._shown)
+                if not self._matches(item)
+            )
+            for item in self._items.values():
+                if id(item) not in self._shown_keys and self._matches(item):
+                    await self._insert(item)
+
+    async def set_key(self, key: Key | None, reverse: bool = False) -> None:
+        """Sort shown items again, rows are moved without re-creating them"""
+        shown = self.shown
+        self.key = key
+        self.reverse = reverse
+        await self.list_view.reorder(self._sort(shown))
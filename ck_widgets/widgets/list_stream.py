@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterable, List, Optional, Union
+
+StreamSource = Union[AsyncIterable[Any], "asyncio.Queue[Any]"]
+
+_END = object()
+
+
+class ListStream:
+    """Items of async iterable or Queue taken in bounded batches
+
+    Async iterables are read by a task into a queue holding at most
+    `buffer` items, so the producer waits while nobody takes items.
+    A Queue given as source is used directly and its `maxsize` applies.
+    """
+
+    def __init__(
+        self, source: StreamSource, *, batch_size: int = 64, buffer: int | None = None
+    ) -> None:
+        self.batch_size = batch_size
+        self.exhausted = False
+        self.error: Optional[BaseException] = None
+        self._reader: Optional[asyncio.Task] = None
+        if isinstance(source, asyncio.Queue):
+            self._source = None
+            self._queue = source
+        else:
+            self._source = source
+            self._queue = asyncio.Queue(maxsize=buffer or batch_size)
+
+    def start(self) -> None:
+        if self._source is not None and self._reader is None:
+            self._reader = asyncio.get_event_loop().create_task(self._read())
+
+    async def _read(self) -> None:
+        assert self._source is not None
+        try:
+            async for item in self._source:
+                await self._queue.put(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            self.error = error
+        await self._queue.put(_END)
+
+    def take(self) -> List[Any]:
+        """Items available now, at most `batch_size`"""
+        items: List[Any] = []
+        queue = self._queue
+        while len(items) < self.batch_size and not queue.empty():
+            item = queue.get_nowait()
+            if item is _END:
+                self.exhausted = True
+                break
+            items.append(item)
+        return items
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
@@ -1,62 +1,597 @@
 from __future__ import annotations
 
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import partial
+from itertools import islice
+
 from rich.console import RenderableType
+from rich.segment import Segment
 
-from textual.geometry import Size, SpacingDimensions
+from textual.geometry import Offset, Region, Size, Spacing, SpacingDimensions
+from textual._context import active_app
+from textual._types import Lines
+from textual.layout import Layout, WidgetPlacement
 from textual.layouts.vertical import VerticalLayout
 from textual.views._window_view import WindowChange
+from textual.message import Message
 from textual.reactive import Reactive
 from textual.widgets import ScrollView
-from textual.widget import Widget
+from textual.widget import RenderCache, Widget
 from textual.view import View
 from textual import messages
 from textual.widgets import Static
 from textual import events
+from textual._timer import Timer
+
+from .frame_scheduler import FrameScheduler, shared_scheduler
+from .height_index import HeightIndex
+from .instrumentation import instrumented
+from .list_stream import ListStream, StreamSource
+
+from typing import (
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+Item = Union[Widget, RenderableType]
+ItemSource = Union[Sequence[Item], Callable[[int], Item]]
+RowHeight = Union[int, Callable[[int], int]]
 
-from typing import List
 
+class VirtualLayout(Layout):
+    """Vertical layout that only creates widgets for items near the viewport
 
-class MultipleWidgetsWindowView(View, layout=VerticalLayout):
-    layout: Reactive[VerticalLayout]
+    Items come from a sequence or a callback with `count`. Row heights are
+    known up front (or estimated), so offsets are known without rendering.
+    Renderables are shown in `Static` widgets that are reused on scroll.
+    """
+
+    def __init__(
+        self,
+        items: ItemSource,
+        count: int | None = None,
+        *,
+        row_height: RowHeight = 1,
+        overscan: int = 10,
+        z: int = 0,
+        gutter: SpacingDimensions = (0, 0, 0, 0),
+    ) -> None:
+        self.row_height = row_height
+        self.overscan = overscan
+        self.z = z
+        self.gutter = Spacing.unpack(gutter)
+        self._widgets: Dict[int, Widget] = {}
+        self._owned: Set[Widget] = set()
+        self._pool: List[Widget] = []
+        self._unmounted: List[Widget] = []
+        super().__init__()
+        self.set_items(items, count)
+
+    def set_items(self, items: ItemSource, count: int | None = None) -> None:
+        if count is None:
+            assert not callable(items), "count is required for callback source"
+            count = len(items)
+        self.items = items
+        self.count = count
+        self._release(range(0))
+        row_height = self.row_height
+        if callable(row_height):
+            self.heights = HeightIndex(row_height(index) for index in range(count))
+        else:
+            self.heights = HeightIndex([row_height] * count)
+
+    def get_item(self, index: int) -> Item:
+        items = self.items
+        return items(index) if callable(items) else items[index]
+
+    def get_widgets(self) -> Iterable[Widget]:
+        return self._widgets.values()
+
+    def take_unmounted(self) -> List[Widget]:
+        """Widgets created since last call, they need to be mounted"""
+        unmounted, self._unmounted = self._unmounted, []
+        return unmounted
+
+    def _release(self, keep: range) -> None:
+        for index in [index for index in self._widgets if index not in keep]:
+            widget = self._widgets.pop(index)
+            if widget in self._owned:
+                self._pool.append(widget)
+
+    def _materialise(self, index: int) -> Widget:
+        widget = self._widgets.get(index)
+        if widget is not None:
+            return widget
+        item = self.get_item(index)
+        if isinstance(item, Widget):
+            widget = item
+            if widget._parent is None:
+                self._unmounted.append(widget)
+        elif self._pool:
+            widget = self._pool.pop()
+            widget.renderable = item
+            widget.refresh()
+        else:
+            widget = Static(item)
+            self._owned.add(widget)
+            self._unmounted.append(widget)
+        self._widgets[index] = widget
+        return widget
+
+    def item_offset(self, index: int) -> int:
+        """Line where item at `index` starts"""
+        return self.gutter.top + self.heights.offset(index)
+
+    def index_at(self, y: int) -> int | None:
+        """Index of item at line `y`, None if there is none"""
+        return self.heights.index_at(y - self.gutter.top)
+
+    def visible_range(self, height: int, scroll_y: int) -> range:
+        heights = self.heights
+        top = max(0, scroll_y - self.overscan)
+        bottom = scroll_y + height + self.overscan
+        start = heights.index_at(top)
+        if start is None:
+            return range(self.count, self.count)
+        end = heights.index_at(bottom - 1)
+        return range(start, self.count if end is None else end + 1)
+
+    def arrange(self, size: Size, scroll: Offset) -> Iterable[WidgetPlacement]:
+        width, height = size
+        gutter = self.gutter
+        x, y = gutter.top_left
+        render_width = width - gutter.width
+        heights = self.heights
+
+        visible = self.visible_range(height, scroll.y - y)
+        self._release(visible)
+        for index in visible:
+            widget = self._materialise(index)
+            region = Region(x, y + heights.offset(index), render_width, heights[index])
+            yield WidgetPlacement(region, widget, (self.z, index))
+
+        yield WidgetPlacement(Region(0, 0, width, heights.total + gutter.height))
+
+
+def _splice_deque(values: Deque, start: int, end: int, new: Sequence) -> list:
+    """Replace `values[start:end]` with `new`, returns removed values"""
+    values.rotate(-start)
+    removed = [values.popleft() for _ in range(end - start)]
+    values.extendleft(reversed(new))
+    values.rotate(start)
+    return removed
+
+
+class _RowBlock(Widget):
+    """Renders a run of plain renderable rows of ListLayout"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: Tuple[RenderableType, ...] = ()
+        self.gap = 0
+        self._row_lines: Dict[int, Tuple[RenderableType, Lines]] = {}
+        self._lines_width = 0
+
+    def set_rows(self, rows: Tuple[RenderableType, ...], gap: int = 0) -> None:
+        current = self.rows
+        if (
+            gap != self.gap
+            or len(rows) != len(current)
+            or any(row is not old for row, old in zip(rows, current))
+        ):
+            self.rows = rows
+            self.gap = gap
+            self.refresh()
+
+    def render_lines(self) -> None:
+        width, height = self.size
+        console = self.console
+        options = console.options.update(width=width, height=None)
+        cached = self._row_lines if self._lines_width == width else {}
+        row_lines: Dict[int, Tuple[RenderableType, Lines]] = {}
+        lines: Lines = []
+        gap_lines = [[Segment(" " * width)]] * self.gap
+        for number, row in enumerate(self.rows):
+            if number and gap_lines:
+                lines.extend(gap_lines)
+            entry = cached.get(id(row))
+            if entry is None or entry[0] is not row:
+                entry = (row, console.render_lines(row, options))
+            row_lines[id(row)] = entry
+            lines.extend(entry[1])
+        # Only rows still shown are kept, reused when scrolling
+        self._row_lines = row_lines
+        self._lines_width = width
+        lines = Segment.set_shape(lines, width, height)
+        self.render_cache = RenderCache(self.size, lines)
+
+
+class ListLayout(VerticalLayout):
+    """VerticalLayout that inserts and removes widgets in place
+
+    Widgets are kept in deques, so appending and dropping widgets from the
+    front are O(1). Heights are kept in a `HeightIndex`, which gives item
+    offsets and the item at a line in O(log n). Widgets are found through
+    an index map.
+
+    Items that are not widgets are kept as plain rows. Rows on screen are
+    drawn by a few pooled `_RowBlock` widgets, one per run of rows.
+
+    Only new and invalidated widgets are measured, all of them only when
+    width changes. Arrangement is cropped to the viewport, so scrolling
+    does not depend on number of widgets.
+    """
 
     def __init__(
         self,
-        widgets: List[RenderableType | Widget] | None = None,
         *,
         auto_width: bool = False,
-        gutter: SpacingDimensions = (0, 0),
-        name: str | None = None
+        z: int = 0,
+        gutter: SpacingDimensions = (0, 0, 0, 0),
     ) -> None:
-        layout = VerticalLayout(gutter=gutter, auto_width=auto_width)
-        super().__init__(name=name, layout=layout)
-        self.set_widgets(widgets)
-        for widget in self._widgets:
-            layout.add(widget)
+        super().__init__(auto_width=auto_width, z=z, gutter=gutter)
+        self._widgets: Deque[Widget] = deque()
+        self._widths: Deque[int] = deque()
+        self._heights = HeightIndex(gap=max(self.gutter.top, self.gutter.bottom))
+        self._measured = 0
+        self._index: Dict[Widget, int] = {}
+        self._indexed = 0
+        self._head = 0
+        self._unmounted: Dict[Widget, None] = {}
+        self._viewport = (0, 0)
+        self._measured_width = -1
+        self._dirty: Dict[Widget, None] = {}
+        self._blocks: List[_RowBlock] = []
+        self._shown_blocks: Set[_RowBlock] = set()
+        self._new_blocks: List[_RowBlock] = []
 
-    async def update(self, widgets: List[Widget | RenderableType] | None) -> None:
-        layout = self.layout
-        assert isinstance(layout, VerticalLayout)
-        self.set_widgets(widgets)
-        await self.arrange_widgets()
+    def __len__(self) -> int:
+        return len(self._widgets)
 
-    def set_widgets(self, widgets: List[Widget | RenderableType] | None) -> None:
-        if widgets is None:
-            return
-        self._widgets: List[Static | Widget] = [
-            w if isinstance(w, Widget) else Static(w) for w in widgets
+    def __bool__(self) -> bool:
+        # View falls back to its layout factory if layout is falsy
+        return True
+
+    def add(self, widget: Widget) -> None:
+        self.insert(len(self._widgets), widget)
+
+    def clear(self) -> None:
+        self._widgets.clear()
+        self._widths.clear()
+        self._heights = HeightIndex(gap=self._heights.gap)
+        self._index.clear()
+        self._unmounted.clear()
+        self._dirty.clear()
+        self._max_widget_width = 0
+        self._measured = self._indexed = self._head = 0
+
+    def set_widgets(self, widgets: List[Widget]) -> None:
+        self.clear()
+        self.splice(0, 0, widgets)
+
+    def _measure(self, widget: Widget) -> int:
+        return widget.app.measure(widget) if self.auto_width else 0
+
+    def insert(self, index: int, widget: Widget) -> None:
+        self.splice(index, index, [widget])
+
+    def pop(self, index: int) -> Widget:
+        return self.splice(index, index + 1)[0]
+
+    def splice(self, start: int, end: int, widgets: Iterable[Widget] = ()) -> List[Widget]:
+        """Replace widgets in `start:end` with `widgets`, returns removed ones"""
+        widgets = list(widgets)
+        widths = [
+            self._measure(widget) if isinstance(widget, Widget) else 0
+            for widget in widgets
         ]
+        count = len(self._widgets)
+        removed = _splice_deque(self._widgets, start, end, widgets)
+        removed_widths = _splice_deque(self._widths, start, end, widths)
+        self._heights.splice(start, end, [-1] * len(widgets))
+        self._max_widget_width = max([self._max_widget_width, *widths])
+        self._forget(removed, removed_widths)
+        self._unmounted.update(
+            (widget, None) for widget in widgets if isinstance(widget, Widget)
+        )
 
-    async def arrange_widgets(self):
-        self.layout.clear()
-        for widget in self._widgets:
-            self.layout.add(widget)
-        self.layout.require_update()
-        self.refresh(layout=True)
+        if start == 0 and not widgets:
+            self._drop_front(len(removed))
+        elif start == end == count:
+            if self._indexed == count:
+                for position, widget in enumerate(widgets, self._head + count):
+                    if isinstance(widget, Widget):
+                        self._index[widget] = position
+                self._indexed += len(widgets)
+        else:
+            self._measured = min(self._measured, start)
+            self._indexed = min(self._indexed, start)
+        return removed
+
+    def _drop_front(self, count: int) -> None:
+        self._measured = max(0, self._measured - count)
+        self._indexed = max(0, self._indexed - count)
+        self._head += count
+
+    def discard(self, indices: Iterable[int]) -> List[Widget]:
+        """Remove widgets at `indices` in one pass, returns removed ones"""
+        count = len(self._widgets)
+        drop = {index for index in indices if 0 <= index < count}
+        if not drop:
+            return []
+        start = min(drop)
+        removed: List[Widget] = []
+        removed_widths: List[int] = []
+        for position in sorted(drop):
+            removed.append(self._widgets[position])
+            removed_widths.append(self._widths[position])
+        for values in (self._widgets, self._widths, self._heights):
+            tail = [
+                value
+                for position, value in enumerate(islice(values, start, None), start)
+                if position not in drop
+            ]
+            if isinstance(values, HeightIndex):
+                values.splice(start, count, tail)
+            else:
+                _splice_deque(values, start, count, tail)
+        self._forget(removed, removed_widths)
+        self._measured = min(self._measured, start)
+        self._indexed = min(self._indexed, start)
+        return removed
+
+    def reorder(self, order: Sequence[int]) -> None:
+        """Put widget at index `order[i]` at `i`, heights move with widgets"""
+        count = len(self._widgets)
+        if len(order) != count:
+            raise ValueError(f"order has {len(order)} indices for {count} widgets")
+        for values in (self._widgets, self._widths):
+            current = list(values)
+            values.clear()
+            values.extend(current[index] for index in order)
+        heights = list(self._heights)
+        self._heights.splice(0, count, [heights[index] for index in order])
+        if self._measured < count:
+            self._measured = 0
+        self._indexed = 0
+
+    def _forget(self, widgets: List[Widget], widths: List[int]) -> None:
+        if not widgets:
+            return
+        for widget in widgets:
+            if isinstance(widget, Widget):
+                self._index.pop(widget, None)
+                self._unmounted.pop(widget, None)
+                self._dirty.pop(widget, None)
+        if self.auto_width and max(widths) >= self._max_widget_width:
+            self._max_widget_width = max(self._widths, default=0)
+
+    def index(self, widget: Widget) -> int:
+        head = self._head
+        position = self._index.get(widget)
+        if position is not None and 0 <= position - head < self._indexed:
+            return position - head
+        start = self._indexed
+        for position, item in enumerate(islice(self._widgets, start, None), start):
+            if isinstance(item, Widget):
+                self._index[item] = head + position
+        self._indexed = len(self._widgets)
+        try:
+            return self._index[widget] - head
+        except KeyError:
+            raise ValueError(f"{widget!r} is not in layout") from None
+
+    def invalidate(self, widget: Widget) -> None:
+        """Measure `widget` again at next arrange, its content changed"""
+        if not isinstance(widget, _RowBlock):
+            self._dirty[widget] = None
+
+    def in_viewport(self, widget: Widget) -> bool:
+        """Check if widget was on screen at last arrange, True if unsure"""
+        if isinstance(widget, _RowBlock):
+            return widget in self._shown_blocks
+        try:
+            index = self.index(widget)
+        except ValueError:
+            return False
+        height = self._heights[index]
+        if index >= self._measured or height < 0:
+            return True
+        top, bottom = self._viewport
+        y = self.gutter.top + self._heights.offset(index)
+        return y < bottom and y + height > top
+
+    async def mount_all(self, view: View) -> None:
+        unmounted, self._unmounted = self._unmounted, {}
+        await view.mount(*unmounted)
+
+    def take_unmounted(self) -> List[Widget]:
+        """Row blocks created since last call, they need to be mounted"""
+        unmounted, self._new_blocks = self._new_blocks, []
+        return unmounted
+
+    def _get_block(self, number: int) -> _RowBlock:
+        if number == len(self._blocks):
+            block = _RowBlock()
+            self._blocks.append(block)
+            self._new_blocks.append(block)
+        return self._blocks[number]
+
+    def _row_span(self, index: int, count: int) -> int:
+        heights = self._heights
+        end = index + count - 1
+        return heights.offset(end) - heights.offset(index) + heights[end]
+
+    def _render_width(self, width: int) -> int:
+        if self.auto_width:
+            return max(width, self._max_widget_width)
+        return width - self.gutter.width
+
+    def _pending(self, render_width: int) -> Iterable[Tuple[int, Item, bool]]:
+        """Items to measure as (index, item, content changed)"""
+        if render_width != self._measured_width:
+            self._measured_width = render_width
+            self._dirty.clear()
+            return ((index, item, True) for index, item in enumerate(self._widgets))
+        # Items in front of `_measured` all have their height
+        start = self._measured
+        rows = islice(zip(self._widgets, self._heights), start, None)
+        pending = {
+            index: (item, False)
+            for index, (item, height) in enumerate(rows, start)
+            if height < 0
+        }
+        dirty, self._dirty = self._dirty, {}
+        for widget in dirty:
+            try:
+                pending[self.index(widget)] = (widget, True)
+            except ValueError:
+                continue
+        return ((index, *pending[index]) for index in sorted(pending))
+
+    def _measure_pending(self, render_width: int) -> None:
+        heights = self._heights
+        changes: List[Tuple[int, int]] = []
+        console = None
+        for index, item, changed in self._pending(render_width):
+            if not isinstance(item, Widget):
+                if console is None:
+                    console = active_app.get().console
+                    options = console.options.update(width=render_width, height=None)
+                render_height = len(console.render_lines(item, options))
+            else:
+                if (
+                    changed
+                    or not item.render_cache
+                    or item.render_cache.size.width != render_width
+                ):
+                    item.render_lines_free(render_width)
+                assert item.render_cache is not None
+                render_height = item.render_cache.size.height
+            if render_height != heights[index]:
+                changes.append((index, render_height))
+        heights.update(changes)
+        self._measured = len(heights)
+
+    @instrumented()
+    def update_heights(self, width: int) -> int:
+        """Measure changed widgets for container `width`, returns content height"""
+        self._measure_pending(self._render_width(width))
+        gutter = self.gutter
+        heights = self._heights
+        total_height = gutter.top + heights.total
+        if heights:
+            total_height += gutter.bottom - heights.gap
+        return total_height
+
+    def item_offset(self, index: int) -> int:
+        """Line where item at `index` starts"""
+        if self._measured_width >= 0:
+            self._measure_pending(self._measured_width)
+        return self.gutter.top + self._heights.offset(index)
+
+    def index_at(self, y: int) -> int | None:
+        """Index of item at line `y`, None if there is none"""
+        if self._measured_width >= 0:
+            self._measure_pending(self._measured_width)
+        return self._heights.index_at(y - self.gutter.top)
+
+    def visible_range(self, top: int, bottom: int) -> range:
+        """Indices of items overlapping `top:bottom` content lines"""
+        heights = self._heights
+        count = len(heights)
+        first = max(0, top - self.gutter.top)
+        last = bottom - 1 - self.gutter.top
+        start = heights.index_at(first)
+        if start is None or last < first:
+            return range(count, count)
+        end = heights.index_at(last)
+        return range(start, count if end is None else end + 1)
+
+    def arrange(self, size: Size, scroll: Offset) -> Iterable[WidgetPlacement]:
+        width, height = size
+        gutter = self.gutter
+        x = gutter.left
+        self._viewport = (scroll.y, scroll.y + height)
+        render_width = self._render_width(width)
+        total_height = self.update_heights(width)
+
+        widgets = self._widgets
+        heights = self._heights
+        top, bottom = self._viewport
+        runs: List[Tuple[int, int, List[RenderableType]]] = []
+        run: List[RenderableType] = []
+        run_top = run_index = 0
+        for index in self.visible_range(top, bottom):
+            widget = widgets[index]
+            y = gutter.top + heights.offset(index)
+            render_height = heights[index]
+            if y + render_height <= top:
+                # Only the gutter above is visible
+                continue
+            if isinstance(widget, Widget):
+                if run:
+                    runs.append((run_index, run_top, run))
+                    run = []
+                region = Region(x, y, render_width, render_height)
+                yield WidgetPlacement(region, widget, (self.z, index))
+            else:
+                if not run:
+                    run_index, run_top = index, y
+                run.append(widget)
+        if run:
+            runs.append((run_index, run_top, run))
+
+        gap = max(gutter.top, gutter.bottom)
+        self._shown_blocks.clear()
+        for number, (index, y, run) in enumerate(runs):
+            block = self._get_block(number)
+            block.set_rows(tuple(run), gap)
+            self._shown_blocks.add(block)
+            run_height = self._row_span(index, len(run))
+            region = Region(x, y, render_width, run_height)
+            yield WidgetPlacement(region, block, (self.z, index))
+
+        yield WidgetPlacement(Region(0, 0, render_width + gutter.width, total_height))
+
+
+class _ListWindowView(View):
+    _window_change_pending = False
+    _scroll_pending = False
+
+    def post_window_change(self) -> None:
+        """Emit one WindowChange for all changes queued until now"""
+        if not self._window_change_pending:
+            self._window_change_pending = True
+            self.post_message_no_wait(
+                events.Callback(self, callback=self._emit_window_change)
+            )
+
+    async def _emit_window_change(self) -> None:
+        self._window_change_pending = False
         await self.emit(WindowChange(self))
 
+    def get_arrangement(self, size: Size, scroll: Offset) -> Iterable[WidgetPlacement]:
+        arrangement = super().get_arrangement(size, scroll)
+        unmounted = self.layout.take_unmounted()
+        if unmounted:
+            self.post_message_no_wait(
+                events.Callback(self, callback=partial(self.mount, *unmounted))
+            )
+        return arrangement
+
     async def handle_update(self, message: messages.Update) -> None:
         message.prevent_default()
-        await self.emit(WindowChange(self))
+        self.post_window_change()
 
     async def handle_layout(self, message: messages.Layout) -> None:
         self.log("TRANSLATING layout")
@@ -67,49 +602,453 @@ class MultipleWidgetsWindowView(View, layout=VerticalLayout):
     async def watch_virtual_size(self, size: Size) -> None:
         await self.emit(WindowChange(self))
 
+    def post_scroll(self) -> None:
+        """Place widgets for new scroll offset, once for all steps queued"""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.post_message_no_wait(events.Callback(self, callback=self._scroll))
+
+    async def _scroll(self) -> None:
+        # Layout stays valid, regions in the root map are absolute so only
+        # the root is reflowed and this view's arrangement is cropped again
+        self._scroll_pending = False
+        if self.app.view.size:
+            await self.app.view.refresh_layout()
+            self.refresh()
+
     async def watch_scroll_x(self, value: int) -> None:
-        self.layout.require_update()
-        self.refresh()
+        self.post_scroll()
 
     async def watch_scroll_y(self, value: int) -> None:
-        self.layout.require_update()
-        self.refresh()
+        self.post_scroll()
 
     async def on_resize(self, event: events.Resize) -> None:
         await self.emit(WindowChange(self))
 
+
+class VirtualWindowView(_ListWindowView, layout=VirtualLayout):
+    layout: Reactive[VirtualLayout]
+
+    def __init__(
+        self,
+        items: ItemSource,
+        count: int | None = None,
+        *,
+        row_height: RowHeight = 1,
+        overscan: int = 10,
+        gutter: SpacingDimensions = (0, 0),
+        name: str | None = None
+    ) -> None:
+        layout = VirtualLayout(
+            items, count, row_height=row_height, overscan=overscan, gutter=gutter
+        )
+        super().__init__(name=name, layout=layout)
+
+    async def update(self, items: ItemSource, count: int | None = None) -> None:
+        self.layout.set_items(items, count)
+        self.layout.require_update()
+        self.refresh(layout=True)
+        await self.emit(WindowChange(self))
+
+
+class MultipleWidgetsWindowView(_ListWindowView, layout=ListLayout):
+    layout: Reactive[ListLayout]
+
+    def __init__(
+        self,
+        widgets: List[RenderableType | Widget] | None = None,
+        *,
+        auto_width: bool = False,
+        gutter: SpacingDimensions = (0, 0),
+        max_items: int | None = None,
+        follow_tail: bool = False,
+        lightweight: bool = False,
+        name: str | None = None
+    ) -> None:
+        layout = ListLayout(gutter=gutter, auto_width=auto_width)
+        super().__init__(name=name, layout=layout)
+        self.lightweight = lightweight
+        self.max_items = max_items
+        self.follow_tail = follow_tail
+        self._at_tail = True
+        self._tail_scroll_y: int | None = None
+        self._batch_depth = 0
+        self._batch_dirty = False
+        self._owned: Set[Widget] = set()
+        self.set_widgets(widgets)
+
+    @property
+    def in_batch(self) -> bool:
+        return self._batch_depth > 0
+
+    @property
+    def following(self) -> bool:
+        """Window is kept scrolled to the last widget"""
+        return self.follow_tail and self._at_tail
+
+    async def refresh_layout(self) -> None:
+        if self.following and self.size:
+            height = self.layout.update_heights(self.size.width)
+            tail = max(0, height - self.size.height)
+            if tail != self.scroll_y:
+                # Set before the reflow below, so it is done in the same pass
+                self._tail_scroll_y = tail
+                self.scroll_y = tail
+        await super().refresh_layout()
+
+    async def watch_scroll_y(self, value: int) -> None:
+        if value == self._tail_scroll_y:
+            self._tail_scroll_y = None
+            return
+        self._tail_scroll_y = None
+        self._at_tail = value + self.size.height >= self.virtual_size.height
+        await super().watch_scroll_y(value)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[MultipleWidgetsWindowView]:
+        """Defer arranging widgets until the outermost batch exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                await self.arrange_widgets()
+
+    async def update(self, widgets: List[Widget | RenderableType] | None) -> None:
+        await self._dispose(self.set_widgets(widgets))
+        await self.arrange_widgets()
+
+    def set_widgets(self, widgets: List[Widget | RenderableType] | None) -> List[Item]:
+        """Replace all widgets, returns replaced ones that are not kept"""
+        if widgets is None:
+            return []
+        if self.max_items is not None:
+            widgets = widgets[max(0, len(widgets) - self.max_items) :]
+        replaced = list(self.layout.get_widgets())
+        items = [self._wrap(widget) for widget in widgets]
+        self.layout.set_widgets(items)
+        kept = {id(item) for item in items}
+        return [item for item in replaced if id(item) not in kept]
+
+    def _wrap(self, widget: Widget | RenderableType) -> Item:
+        if isinstance(widget, Widget) or self.lightweight:
+            return widget
+        static = Static(widget)
+        self._owned.add(static)
+        return static
+
+    async def _dispose(self, removed: Iterable[Item]) -> None:
+        """Stop Statics created for removed renderables"""
+        for widget in removed:
+            if isinstance(widget, Widget) and widget in self._owned:
+                self._owned.discard(widget)
+                self.widgets.discard(widget)
+                if widget in self.app.children:
+                    await self.app.remove(widget)
+                widget.close_messages_no_wait()
+
+    async def _trim(self) -> None:
+        """Drop oldest widgets above `max_items`"""
+        if self.max_items is not None and len(self.layout) > self.max_items:
+            await self._dispose(
+                self.layout.splice(0, len(self.layout) - self.max_items)
+            )
+
+    async def handle_update(self, message: messages.Update) -> None:
+        self.layout.invalidate(message.widget)
+        if not self.layout.in_viewport(message.widget):
+            message.prevent_default()
+            message.stop()
+            return
+        await super().handle_update(message)
+
+    async def handle_layout(self, message: messages.Layout) -> None:
+        if isinstance(message.sender, Widget):
+            self.layout.invalidate(message.sender)
+        await super().handle_layout(message)
+
+    @instrumented()
+    async def arrange_widgets(self):
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._batch_dirty = False
+        await self._trim()
+        self.layout.require_update()
+        self.refresh(layout=True)
+        self.post_window_change()
+
     async def add_widget(
         self, widget: Widget | RenderableType, index: int | None = None
     ):
+        count = len(self.layout)
+        if index is None:
+            index = count
+        index = min(count, max(0, index))
+        self.layout.insert(index, self._wrap(widget))
+        await self.arrange_widgets()
+
+    async def add_widgets(
+        self, widgets: Iterable[Widget | RenderableType], index: int | None = None
+    ):
+        count = len(self.layout)
         if index is None:
-            index = len(self._widgets)
-        index = min(len(self._widgets), max(0, index))
-        self._widgets.insert(
-            index, widget if isinstance(widget, Widget) else Static(widget)
+            index = count
+        index = min(count, max(0, index))
+        self.layout.splice(index, index, [self._wrap(widget) for widget in widgets])
+        await self.arrange_widgets()
+
+    async def remove_widgets(
+        self, which: Iterable[int] | Callable[[Widget], bool]
+    ) -> List[Widget]:
+        if callable(which):
+            widgets = self.layout.get_widgets()
+            which = [index for index, widget in enumerate(widgets) if which(widget)]
+        removed = self.layout.discard(which)
+        if removed:
+            await self._dispose(removed)
+            await self.arrange_widgets()
+        return removed
+
+    async def replace_range(
+        self, start: int, end: int, widgets: Iterable[Widget | RenderableType]
+    ) -> List[Widget]:
+        start, end, _ = slice(start, end).indices(len(self.layout))
+        removed = self.layout.splice(
+            start, max(start, end), [self._wrap(widget) for widget in widgets]
         )
+        await self._dispose(removed)
+        await self.arrange_widgets()
+        return removed
+
+    async def reorder(self, order: Sequence[int]) -> None:
+        self.layout.reorder(order)
         await self.arrange_widgets()
 
+    async def promote(
+        self, index: int, factory: Callable[[RenderableType], Widget] = Static
+    ) -> Widget:
+        """Replace plain row at `index` with widget made by `factory`"""
+        item = self.layout.get_widgets()[index]
+        if isinstance(item, Widget):
+            return item
+        widget = factory(item)
+        self._owned.add(widget)
+        self.layout.splice(index, index + 1, [widget])
+        await self.arrange_widgets()
+        return widget
+
     async def remove_widget_by_index(self, index: int = 0):
-        if not self._widgets:
-            return 
-        index = min(len(self._widgets)-1, max(0, index))
-        self._widgets.pop(index)
+        if not len(self.layout):
+            return
+        index = min(len(self.layout) - 1, max(0, index))
+        await self._dispose([self.layout.pop(index)])
         await self.arrange_widgets()
 
     async def remove_widget(self, widget: Widget):
-        if not self._widgets:
-            return 
-        self._widgets.remove(widget)
+        if not len(self.layout):
+            return
+        await self._dispose([self.layout.pop(self.layout.index(widget))])
         await self.arrange_widgets()
 
 
 class ListViewUo(ScrollView):
+    scheduler: FrameScheduler | None = shared_scheduler
+
     def __init__(
-        self, widgets: List[Widget | RenderableType] | None = None, *args, **kwargs
+        self,
+        widgets: List[Widget | RenderableType] | None = None,
+        *args,
+        max_items: int | None = None,
+        follow_tail: bool = False,
+        lightweight: bool = False,
+        window: _ListWindowView | None = None,
+        **kwargs
     ) -> None:
         super().__init__(*args, **kwargs)
         self.widgets_list = widgets
-        self.window = MultipleWidgetsWindowView(self.widgets_list)
+        if window is None:
+            window = MultipleWidgetsWindowView(
+                self.widgets_list,
+                max_items=max_items,
+                follow_tail=follow_tail,
+                lightweight=lightweight,
+            )
+        self.window = window
+        self._tail_y: float | None = None
+        self._mounted = False
+        self._visible = False
+        self._stream: ListStream | None = None
+        self._stream_fps = 30.0
+        self._stream_timer: Timer | None = None
+
+    @classmethod
+    def stream(
+        cls,
+        source: StreamSource,
+        *,
+        max_items: int | None = None,
+        follow_tail: bool = True,
+        batch_size: int = 64,
+        fps: float = 30.0,
+        **kwargs
+    ) -> ListViewUo:
+        """ListView appending items from async iterable or Queue
+
+        Args:
+            source: Async iterable or Queue of widgets or renderables
+            max_items: Oldest rows are dropped above this count
+            follow_tail: Keep newest rows in view while scrolled to bottom
+            batch_size: Maximum items added per frame
+            fps: Frames per second
+        """
+        list_view = cls(max_items=max_items, follow_tail=follow_tail, **kwargs)
+        list_view._stream = ListStream(source, batch_size=batch_size)
+        list_view._stream_fps = fps
+        return list_view
+
+    async def handle_window_change(self, message: Message) -> None:
+        window = self.window
+        if isinstance(window, MultipleWidgetsWindowView) and window.following:
+            self._tail_y = window.scroll_y
+            self.y = self.target_y = window.scroll_y
+        await super().handle_window_change(message)
+
+    async def watch_y(self, new_value: float) -> None:
+        if new_value == self._tail_y:
+            # Window scrolled itself, it may already be further down
+            self.vscroll.position = round(new_value)
+            return
+        self._tail_y = None
+        await super().watch_y(new_value)
+
+    async def on_mount(self, event: events.Mount) -> None:
+        self._mounted = True
+        if self._stream is not None and self._stream_timer is None:
+            self._start_stream()
+
+    async def on_show(self, event: events.Show) -> None:
+        self._visible = True
+        if self._stream_timer is not None:
+            self._stream_timer.resume()
+
+    async def on_hide(self, event: events.Hide) -> None:
+        self._visible = False
+        if self._stream_timer is not None:
+            self._stream_timer.pause()
+
+    async def consume(
+        self, source: StreamSource, *, batch_size: int = 64, fps: float = 30.0
+    ) -> ListStream:
+        """Append items from async iterable or Queue, one batch per frame
+
+        Reading pauses while the list is hidden, producer then waits on
+        full queue. Replaces previous stream.
+        """
+        await self.stop_stream()
+        self._stream = ListStream(source, batch_size=batch_size)
+        self._stream_fps = fps
+        if self._mounted:
+            self._start_stream()
+        return self._stream
+
+    def _start_stream(self) -> None:
+        assert self._stream is not None
+        self._stream.start()
+        self._stream_timer = self.set_interval(
+            1 / self._stream_fps, callback=self._pull_stream, name="stream"
+        )
+        if not self._visible:
+            self._stream_timer.pause()
+
+    async def stop_stream(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._stream_timer is not None:
+            timer, self._stream_timer = self._stream_timer, None
+            await timer.stop()
+
+    async def _pull_stream(self) -> None:
+        stream = self._stream
+        if stream is None:
+            return
+        items = stream.take()
+        if items:
+            await self.add_widgets(items)
+        if stream.exhausted:
+            await self.stop_stream()
+            if stream.error is not None:
+                raise stream.error
+
+    @classmethod
+    def virtual(
+        cls,
+        items: ItemSource,
+        count: int | None = None,
+        *,
+        row_height: RowHeight = 1,
+        overscan: int = 10,
+        **kwargs
+    ) -> ListViewUo:
+        """ListView creating widgets only for the rows that are on screen
+
+        Items are changed only with `await list_view.window.update(items, count)`,
+        methods adding or removing widgets raise `TypeError`.
+
+        Args:
+            items: Sequence of items or callback returning item for index
+            count: Number of items, required for callback
+            row_height: Height of every row or callback returning it for index
+            overscan: Rows materialised above and below the viewport
+        """
+        window = VirtualWindowView(
+            items, count, row_height=row_height, overscan=overscan
+        )
+        return cls(window=window, **kwargs)
+
+    @property
+    def _widgets_window(self) -> MultipleWidgetsWindowView:
+        window = self.window
+        if not isinstance(window, MultipleWidgetsWindowView):
+            raise TypeError(
+                "virtual ListViewUo is changed only with window.update(items, count)"
+            )
+        return window
+
+    def index_at_offset(self, y: int) -> int | None:
+        """Index of item at line `y` of the list, None if there is none
+
+        Line under screen row `row` of the list is `list_view.y + row`.
+        """
+        return self.window.layout.index_at(round(y))
+
+    def scroll_to_index(self, index: int, animate: bool = False) -> None:
+        """Scroll so item at `index` is at the top, as far as possible"""
+        self.target_y = self.window.layout.item_offset(index)
+        if animate:
+            self.animate("y", self.target_y, easing="out_cubic")
+        else:
+            self.y = self.target_y
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[ListViewUo]:
+        """Apply all changes made inside with one layout pass
+
+        ```python
+        async with list_view.batch():
+            for line in lines:
+                await list_view.add_widget(line)
+        ```
+        """
+        window = self._widgets_window
+        try:
+            async with window.batch():
+                yield self
+        finally:
+            if not window.in_batch:
+                self.refresh_all()
 
     def refresh_all(self):
         self.window.layout.require_update()
@@ -118,15 +1057,62 @@ class ListViewUo(ScrollView):
         self.vscroll.refresh()
         self.hscroll.refresh()
 
-    async def add_widget(self, widget:Widget, index:int|None = None):
-        await self.window.add_widget(widget, index)
-        self.refresh_all()
+    def _refresh_changed(self):
+        # Scroll bars and outer layout follow changes once per frame
+        if getattr(self.window, "in_batch", False):
+            return
+        if self.scheduler is None:
+            self.refresh_all()
+        else:
+            self.scheduler.request(self, self.refresh_all)
+
+    async def add_widget(self, widget: Widget, index: int | None = None):
+        await self._widgets_window.add_widget(widget, index)
+        self._refresh_changed()
+
+    async def add_widgets(
+        self, widgets: Iterable[Widget | RenderableType], index: int | None = None
+    ):
+        """Insert `widgets` at `index` (end of list by default)"""
+        await self._widgets_window.add_widgets(widgets, index)
+        self._refresh_changed()
+
+    async def reorder(self, order: Sequence[int]) -> None:
+        """Show item at index `order[i]` at `i`, without measuring it again"""
+        await self._widgets_window.reorder(order)
+        self._refresh_changed()
+
+    async def promote(
+        self, index: int, factory: Callable[[RenderableType], Widget] = Static
+    ) -> Widget:
+        """Turn plain row at `index` into a widget, e.g. to handle clicks"""
+        widget = await self._widgets_window.promote(index, factory)
+        self._refresh_changed()
+        return widget
 
-    async def remove_widget_by_index(self, index: int=0):
-        await self.window.remove_widget_by_index(index)
-        self.refresh_all()
+    async def remove_widget_by_index(self, index: int = 0):
+        await self._widgets_window.remove_widget_by_index(index)
+        self._refresh_changed()
 
     async def remove_widget(self, widget: Widget):
-        await self.window.remove_widget(widget)
-        self.refresh_all()
+        await self._widgets_window.remove_widget(widget)
+        self._refresh_changed()
+
+    async def remove_widgets(
+        self, which: Iterable[int] | Callable[[Widget], bool]
+    ) -> List[Widget]:
+        """Remove widgets at given indices or matching predicate
+
+        Indices out of range are ignored. Returns removed widgets.
+        """
+        removed = await self._widgets_window.remove_widgets(which)
+        self._refresh_changed()
+        return removed
 
+    async def replace_range(
+        self, start: int, end: int, widgets: Iterable[Widget | RenderableType]
+    ) -> List[Widget]:
+        """Replace widgets in `start:end` slice, returns removed widgets"""
+        removed = await self._widgets_window.replace_range(start, end, widgets)
+        self._refresh_changed()
+        return removed
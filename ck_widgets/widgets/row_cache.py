@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Tuple
+
+from rich.segment import Segment
+
+Row = Tuple[Segment, ...]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RowCache:
+    """LRU cache of rendered rows
+
+    One instance can be shared between many widgets, as long as keys
+    contain everything that changes how a row looks.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._rows: OrderedDict[Hashable, Row] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: Hashable) -> Optional[Row]:
+        row = self._rows.get(key)
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._rows.move_to_end(key)
+        return row
+
+    def __setitem__(self, key: Hashable, row: Row) -> None:
+        self._rows[key] = row
+        self._rows.move_to_end(key)
+        while len(self._rows) > self.maxsize:
+            self._rows.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._rows))
+
+    def cache_clear(self) -> None:
+        self._rows.clear()
+        self.hits = self.misses = 0
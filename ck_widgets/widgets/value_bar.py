@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import sys
+from array import array
+from collections import deque
+from functools import lru_cache
+from time import monotonic
 from rich.console import RenderableType
 from rich.style import StyleType, Style
 from rich.color import Color, blend_rgb
@@ -9,18 +13,22 @@ from rich.text import TextType, Text
 from textual.geometry import Size
 
 from textual.reactive import Reactive
-from textual.widget import Widget
+from textual.widget import RenderCache, Widget
 from textual import events
 from textual.message import Message, MessageTarget
 
 from rich.panel import Panel
 from rich.box import Box, ROUNDED
 from rich.repr import Result
+from rich.segment import Segment
 
 from typing import Optional
-from typing import List, Tuple, Union
+from typing import Deque, Hashable, Iterable, Iterator, List, Tuple
 
-from ck_widgets.color import CColor, CustomColor
+from ck_widgets.color import ColorPalette, ColorSpec
+from .frame_scheduler import FrameScheduler, ScheduledRefresh, shared_scheduler
+from .instrumentation import instrumentation, instrumented
+from .row_cache import Row, RowCache
 
 if sys.version_info >= (3, 8):
     from typing import Literal
@@ -33,6 +41,44 @@ def minmax(a, mn, mx):
 
 
 LabelPosition = Literal["top", "bottom"]
+EmitPolicy = Literal["always", "change", "throttle", "debounce", "coalesce"]
+
+
+@lru_cache(maxsize=1024)
+def cell_style(color, bgcolor) -> Style:
+    """Interned Style for a (color, bgcolor) pair, shared by all bars"""
+    return Style(color=color, bgcolor=bgcolor)
+
+
+@lru_cache(maxsize=1024)
+def reverse_style(style: Style) -> Style:
+    """Interned `style` with swapped foreground and background"""
+    return style + Style(reverse=True)
+
+
+instrumentation.count_styles(cell_style, reverse_style)
+
+
+# Blocks filling k eighths of a cell from the left and from the bottom
+LEFT_EIGHTHS = " ▏▎▍▌▋▊▉█"
+LOWER_EIGHTHS = " ▁▂▃▄▅▆▇█"
+
+
+def merge_runs(cells: Iterable[Tuple[str, Style]]) -> Iterator[Segment]:
+    """Merge neighbouring cells with the same char and style into segments
+
+    Styles are compared by identity, so cells should use `cell_style`.
+    """
+    run_char, run_style, run_length = "", None, 0
+    for char, style in cells:
+        if style is run_style and char == run_char:
+            run_length += 1
+            continue
+        if run_length:
+            yield Segment(run_char * run_length, run_style)
+        run_char, run_style, run_length = char, style, 1
+    if run_length:
+        yield Segment(run_char * run_length, run_style)
 
 
 class ValueBarChange(Message):
@@ -41,16 +87,28 @@ class ValueBarChange(Message):
         self.value = sender.value
         self.fill = sender.fill
         self.max_value = sender._max_value
+        self.coalesce = sender.emit_policy == "coalesce"
+
+    def can_replace(self, message: Message) -> bool:
+        return (
+            self.coalesce
+            and isinstance(message, ValueBarChange)
+            and message.sender is self.sender
+        )
 
 
-class _ValueBar(Widget):
+class _ValueBar(ScheduledRefresh, Widget):
     """
     ValueBar Base classc
     """
 
+    # Mouse sets the fill, textual calls `on_mouse_*` of every base class
+    # so subclasses opt out here instead of overriding the handlers
+    interactive: bool = True
     is_mouse_down: Reactive = Reactive(False)
     value: Reactive = Reactive(0)
     fill: Reactive = Reactive(0)
+    partial: Reactive = Reactive(0)
 
     def __init__(
         self,
@@ -59,8 +117,8 @@ class _ValueBar(Widget):
         max_value: int | None = None,
         reversed: bool = False,
         instant: bool = False,
-        color: Optional[Union[CColor, List[CColor], CustomColor]] = None,
-        bg_color: Optional[Union[CColor, List[CColor], CustomColor]] = None,
+        color: ColorSpec = None,
+        bg_color: ColorSpec = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
         label: Optional[TextType] = None,
@@ -69,6 +127,13 @@ class _ValueBar(Widget):
         padding: Tuple[int, int] = (0, 0),
         border_style: StyleType = "none",
         box: Box = ROUNDED,
+        row_cache: Optional[RowCache] = None,
+        emit_policy: EmitPolicy = "always",
+        emit_rate: float = 30.0,
+        emit_delay: float = 0.1,
+        scheduler: Optional[FrameScheduler] = shared_scheduler,
+        value_range: Optional[Tuple[float, float]] = None,
+        high_resolution: bool = False,
     ) -> None:
         """ValueBar constructor
 
@@ -92,10 +157,26 @@ class _ValueBar(Widget):
             padding: Padding between value part and border
             border_style: Border style
             box: Rich's box type
+            row_cache: Cache for rendered rows, can be shared between bars
+            emit_policy: When `ValueBarChange` is sent during mouse drag:
+            "always" on every mouse event, "change" only when value or fill changed,
+            "throttle" at most `emit_rate` times per second, "debounce" after
+            `emit_delay` seconds without change, "coalesce" one message with
+            the latest value per burst of queued mouse events.
+            All but "always" skip unchanged values
+            emit_rate: Max messages per second for "throttle"
+            emit_delay: Quiet time in seconds for "debounce"
+            scheduler: Repaints are coalesced per frame by this scheduler,
+            None repaints on every change
+            value_range: `(min_value, max_value)` of values given to `update`,
+            mapped onto the cells of the bar. None means values are in cells
+            high_resolution: Draw the cell at the end of fill with eighth
+            blocks, `update` then has 8 levels per cell
 
         """
 
         super().__init__(name=name)
+        self.scheduler = scheduler
         self.color = color
         self.bg_color = bg_color
         self.label = label
@@ -106,8 +187,29 @@ class _ValueBar(Widget):
         self.reversed = reversed
         self.instant = instant
         self._padding: Tuple[int, int] = padding
+        self.row_cache = RowCache() if row_cache is None else row_cache
+        self.emit_policy: EmitPolicy = emit_policy
+        self.emit_rate = emit_rate
+        self.emit_delay = emit_delay
+        self._emitted_at = 0.0
+        self._emit_due = 0.0
+        self._emit_scheduled = False
+        self._styles_key: Hashable = None
+        self._styles: Tuple[List[Style], List[Style]] = ([], [])
+        self._lines: Optional[List[List[Segment]]] = None
+        self._lines_key: Hashable = None
+        self._lines_boundary = 0
+        self._rendered_cells = 0
+        self.resolution = 8 if high_resolution else 1
+        self.source_value: Optional[float] = None
+        self._scale_cells = -1
+        self._scale = 1.0
+        self._low = 0.0
+        self.value_range = value_range
 
         self._set_size_and_values(start_value, max_value, width, height)
+        # Start value is not a change
+        self._emitted: Tuple[int, int] = (self.value, self.fill)
 
     def __rich_repr__(self) -> Result:
         yield self.name
@@ -159,20 +261,35 @@ class _ValueBar(Widget):
     def _color_direction(self, _, y):
         return y
 
-    def _color_xy(self, x, y, bg=False):
-        if bg:
-            color = self.bg_color
-        else:
-            color = self.color
-
-        if isinstance(color, list):
-            w = self._color_direction(x, y) % len(color)
-            return color[w]
-        elif isinstance(color, CustomColor):
-            w = self._color_direction(x, y)
-            return color.get_color(w, self._max_value)
-        else:
-            return color
+    @property
+    def color(self) -> ColorSpec:
+        return self._color.source
+
+    @color.setter
+    def color(self, color: ColorSpec) -> None:
+        self._color = ColorPalette(color)
+
+    @property
+    def bg_color(self) -> ColorSpec:
+        return self._bg_color.source
+
+    @bg_color.setter
+    def bg_color(self, color: ColorSpec) -> None:
+        self._bg_color = ColorPalette(color)
+
+    def _style_tables(self) -> Tuple[List[Style], List[Style]]:
+        """Styles of filled and empty cells indexed by color position"""
+        size = self._max_value
+        key = (size, self._color.key, self._bg_color.key)
+        if key != self._styles_key:
+            colors = self._color.colors(size)
+            bg_colors = self._bg_color.colors(size)
+            self._styles = (
+                [cell_style(c, bg) for c, bg in zip(colors, bg_colors)],
+                [cell_style(None, bg) for bg in bg_colors],
+            )
+            self._styles_key = key
+        return self._styles
 
     def _mouse_axis(self, event) -> int:
         y = event.y
@@ -183,32 +300,209 @@ class _ValueBar(Widget):
             return self._max_value
         return y - pad
 
-    def update(self, value):
-        self.value = value
-        self.fill = value * self._size.height // 255
+    @property
+    def value_range(self) -> Optional[Tuple[float, float]]:
+        return self._value_range
+
+    @value_range.setter
+    def value_range(self, value_range: Optional[Tuple[float, float]]) -> None:
+        self._value_range = value_range
+        self._scale_cells = -1
+        self._rescale()
+
+    def _update_scale(self, cells: int) -> None:
+        low, high = self._value_range or (0, cells)
+        span = high - low
+        self._low = low
+        self._scale = cells * self.resolution / span if span else 0.0
+        self._scale_cells = cells
+
+    def quantise(self, value: float) -> int:
+        """Fill level of `value` from `value_range`, in cells * `resolution`"""
+        cells = self._max_value
+        if cells != self._scale_cells:
+            self._update_scale(cells)
+        level = int((value - self._low) * self._scale)
+        return minmax(level, 0, cells * self.resolution)
+
+    def update(self, value: float) -> bool:
+        """Show `value` from `value_range`, returns if the fill changed
+
+        Nothing is refreshed while the value stays on the same level.
+        """
+        self.source_value = value
+        return self.set_level(*divmod(self.quantise(value), self.resolution))
 
-    def render_fill(self) -> Text:
-        text = Text()
-        r1 = self._fill_height
+    def set_level(self, fill: int, partial: int = 0) -> bool:
+        """Show `fill` cells and `partial` of the next, returns if it changed
+
+        `partial` is in 1/`resolution` of cell, value is set to `fill`.
+        """
+        if fill == self.fill and fill == self.value and partial == self.partial:
+            return False
+        self.value = fill
+        self.fill = fill
+        self.partial = partial
+        # Set from code, not a change to report on the next leave
+        self._emitted = (fill, fill)
+        return True
+
+    def _rescale(self) -> None:
+        """Map the last `update` value again, cells or `value_range` changed"""
+        if self.source_value is not None:
+            self.update(self.source_value)
+
+    async def on_resize(self, event: events.Resize) -> None:
+        # Widget.on_resize refreshes, textual calls it after this one
+        if self._max_value != self._scale_cells:
+            self._rescale()
+
+    def _eighths(self, r1, position) -> int:
+        """Eighths of cell `position` before the boundary `r1`"""
+        resolution = self.resolution
+        return minmax(r1 - position * resolution, 0, resolution) * 8 // resolution
+
+    def _row_key(self, h, r1) -> Hashable:
+        return h, self._eighths(r1, h)
+
+    def _render_row(self, h, r1) -> Row:
         first = "█"
         second = " "
         if self.reversed:
-            r1 = self._max_value - r1
             first, second = second, first
 
-        for h in range(r1):
-            for w in range(self._fill_width):
-                color = self._color_xy(w, h)
-                bg_color = self._color_xy(w, h, bg=True)
-                text.append(first, style=Style(color=color, bgcolor=bg_color))
-            text.append("\n")
-        for h in range(r1, self._max_value):
-            for w in range(self._fill_width):
-                bg_color = self._color_xy(w, h, bg=True)
-                text.append(second, style=Style(bgcolor=bg_color))
+        filled, empty = self._style_tables()
+        direction = self._color_direction
+        fill_width = self._fill_width
+        eighths = self._eighths(r1, h)
+        if eighths == 8:
+            cells = ((first, filled[direction(w, h)]) for w in range(fill_width))
+        elif eighths == 0:
+            cells = ((second, empty[direction(w, h)]) for w in range(fill_width))
+        else:
+            # Upper part is drawn as the first half, lower blocks as the second
+            char = LOWER_EIGHTHS[8 - eighths]
+            if self.reversed:
+                cells = ((char, empty[direction(w, h)]) for w in range(fill_width))
+            else:
+                cells = (
+                    (char, reverse_style(filled[direction(w, h)]))
+                    for w in range(fill_width)
+                )
+        return tuple(merge_runs(cells))
+
+    def _boundary(self) -> int:
+        """Fill end in cells * `resolution` from the start of the bar"""
+        level = self.fill * self.resolution + self.partial
+        if self.reversed:
+            return self._max_value * self.resolution - level
+        return level
+
+    def _row_prefix(self) -> Hashable:
+        return (
+            type(self),
+            self._color.key,
+            self._bg_color.key,
+            self.reversed,
+            self._max_width,
+            self._max_value,
+            self.resolution,
+        )
+
+    def _row(self, prefix, h, r1) -> Row:
+        key = (prefix, self._row_key(h, r1))
+        row = self.row_cache.get(key)
+        if row is None:
+            row = self.row_cache[key] = self._render_row(h, r1)
+        return row
+
+    @instrumented(cells=lambda bar, text: len(text) - text.plain.count("\n"))
+    def render_fill(self) -> Text:
+        text = Text()
+        r1 = self._boundary()
+        prefix = self._row_prefix()
+        for h in range(self._max_height):
+            for segment in self._row(prefix, h, r1):
+                text.append(segment.text, segment.style)
             text.append("\n")
         return text
 
+    def _dirty_cells(self, r_old, r_new) -> Tuple[int, int]:
+        """Cells that differ between two boundaries"""
+        resolution = self.resolution
+        start = min(r_old, r_new) // resolution
+        end = -(-max(r_old, r_new) // resolution)
+        return start, end
+
+    def _dirty_region(self, r_old, r_new) -> Tuple[range, int, int]:
+        """Rows and columns of the bar that differ between two boundaries"""
+        return range(*self._dirty_cells(r_old, r_new)), 0, self._fill_width
+
+    def _frame_key(self) -> Hashable:
+        return (
+            self.size,
+            self.width,
+            self.height,
+            self.label,
+            self.label_align,
+            self.label_position,
+            self._border_style,
+            self.box,
+            self._padding,
+            self._row_prefix(),
+        )
+
+    def _can_patch(self) -> bool:
+        width, height = self.size
+        return (
+            self.padding is None
+            and self.margin is None
+            and self.border not in self.BOX_MAP
+            and not self.style
+            and self.width <= width
+            and self.height <= height
+        )
+
+    def _patch_lines(self) -> Optional[List[List[Segment]]]:
+        """Previous lines with only the cells between old and new fill replaced"""
+        if self._lines is None or self._lines_key != self._frame_key():
+            return None
+        r_old, r_new = self._lines_boundary, self._boundary()
+        lines = list(self._lines)
+        rows, start, end = self._dirty_region(r_old, r_new)
+        self._rendered_cells = len(rows) * (end - start)
+        if start == end:
+            return lines
+
+        y0 = 1 + self._padding[0]
+        x0 = 1 + self._padding[1]
+        prefix = self._row_prefix()
+        panel_style = self.console.get_style(self._border_style)
+        divide = Segment.divide
+        for h in rows:
+            line = lines[y0 + h]
+            line_length = Segment.get_line_length(line)
+            before, _, after = divide(line, [x0 + start, x0 + end, line_length])
+            middle = list(divide(self._row(prefix, h, r_new), [start, end]))[1]
+            middle = list(Segment.apply_style(middle, panel_style))
+            lines[y0 + h] = before + middle + after
+        return lines
+
+    @instrumented(cells=lambda bar, _: bar._rendered_cells)
+    def render_lines(self) -> None:
+        lines = self._patch_lines() if self._can_patch() else None
+        if lines is None:
+            self._rendered_cells = self.size.area
+            super().render_lines()
+            assert self.render_cache is not None
+            lines = self.render_cache.lines
+        else:
+            self.render_cache = RenderCache(self.size, lines)
+        self._lines = lines
+        self._lines_key = self._frame_key()
+        self._lines_boundary = self._boundary()
+
+    @instrumented()
     def render(self) -> RenderableType:
         bar = self.render_fill()
 
@@ -240,31 +534,85 @@ class _ValueBar(Widget):
             self.fill = self._max_value - mn_mx
         else:
             self.fill = mn_mx
+        self.partial = 0
+
+    async def _send_change(self) -> None:
+        state = (self.value, self.fill)
+        if self.emit_policy != "always" and state == self._emitted:
+            return
+        self._emitted = state
+        self._emitted_at = monotonic()
+        await self.emit(ValueBarChange(self))
+
+    def _schedule_change(self, delay: float) -> None:
+        if not self._emit_scheduled:
+            self._emit_scheduled = True
+            self.set_timer(delay, callback=self._on_change_timer)
+
+    async def _on_change_timer(self) -> None:
+        self._emit_scheduled = False
+        wait = self._emit_due - monotonic()
+        if wait > 0:
+            self._schedule_change(wait)
+        else:
+            await self._send_change()
+
+    async def emit_change(self, final: bool = False) -> None:
+        """Send `ValueBarChange` following `emit_policy`
+
+        Args:
+            final: End of interaction, pending change is sent right away
+        """
+        policy = self.emit_policy
+        if final or policy in ("always", "change"):
+            self._emit_due = 0.0
+            await self._send_change()
+        elif policy == "coalesce":
+            if not self._emit_scheduled:
+                self._emit_scheduled = True
+                self.post_message_no_wait(
+                    events.Callback(self, callback=self._on_change_timer)
+                )
+        elif policy == "throttle":
+            self._emit_due = self._emitted_at + 1 / self.emit_rate
+            wait = self._emit_due - monotonic()
+            if wait <= 0:
+                await self._send_change()
+            else:
+                self._schedule_change(wait)
+        elif policy == "debounce":
+            self._emit_due = monotonic() + self.emit_delay
+            self._schedule_change(self.emit_delay)
 
     async def on_mouse_down(self, event: events.MouseDown) -> None:
+        if not self.interactive:
+            return
+        self.source_value = None
         self.set_fill(event)
         self.value = self.fill
         self.is_mouse_down = True
-        await self.emit(ValueBarChange(self))
+        await self.emit_change()
 
     async def on_mouse_move(self, event: events.MouseMove) -> None:
-        if self.is_mouse_down:
+        if self.interactive and self.is_mouse_down:
             self.set_fill(event)
             if self.instant:
                 self.value = self.fill
-            await self.emit(ValueBarChange(self))
+            await self.emit_change()
 
     async def on_mouse_up(self, event: events.MouseUp):
-        if self.is_mouse_down:
+        if self.interactive and self.is_mouse_down:
             self.set_fill(event)
             self.value = self.fill
             self.is_mouse_down = False
-            await self.emit(ValueBarChange(self))
+            await self.emit_change(final=True)
 
     async def on_leave(self, event: events.Leave):
+        if not self.interactive:
+            return
         self.value = self.fill
         self.is_mouse_down = False
-        await self.emit(ValueBarChange(self))
+        await self.emit_change(final=True)
 
 
 class ValueBarV(_ValueBar):
@@ -316,22 +664,120 @@ class ValueBarH(_ValueBar):
     def _color_direction(self, x, _):
         return x
 
-    def render_fill(self) -> Text:
-        text = Text()
-        r1 = self._fill_width
-        first = "█"
-        second = " "
-        if self.reversed:
-            r1 = self._max_value - r1
-            first, second = second, first
-        for h in range(self._fill_height):
-            for w in range(0, r1):
-                color = self._color_xy(w, h)
-                bg_color = self._color_xy(w, h, True)
-                text.append(first, style=Style(color=color, bgcolor=bg_color))
-            for w in range(r1, self._max_value):
-                color = self._color_xy(w, h)
-                bg_color = self._color_xy(w, h, True)
-                text.append(second, style=Style(color=color, bgcolor=bg_color))
-            text.append("\n")
-        return text
+    def _row_key(self, h, r1) -> Hashable:
+        return r1
+
+    def _dirty_region(self, r_old, r_new) -> Tuple[range, int, int]:
+        return range(self._max_height), *self._dirty_cells(r_old, r_new)
+
+    def _cell(self, w, r1, style) -> Tuple[str, Style]:
+        eighths = self._eighths(r1, w)
+        if eighths == 8:
+            return (" " if self.reversed else "█"), style
+        if eighths == 0:
+            return ("█" if self.reversed else " "), style
+        # Left part is drawn as the first half, block colours swap when reversed
+        char = LEFT_EIGHTHS[eighths]
+        return char, reverse_style(style) if self.reversed else style
+
+    def _render_row(self, h, r1) -> Row:
+        filled, _ = self._style_tables()
+        cell = self._cell
+        cells = (
+            cell(w, r1, filled[self._color_direction(w, h)])
+            for w in range(self._max_value)
+        )
+        return tuple(merge_runs(cells))
+
+
+class ValueBarHistory(ValueBarV):
+    """
+    ValueBar history chart, one column per sample with the newest on the right
+    """
+
+    interactive = False
+
+    def __init__(self, samples: int = 60, **kwargs) -> None:
+        """ValueBarHistory constructor
+
+        Takes the same arguments as `ValueBarV`, values given to `push` are
+        mapped from `value_range` onto the chart height.
+
+        Args:
+            samples: Number of kept samples, also the default chart width
+        """
+        padding = kwargs.get("padding", (0, 0))
+        kwargs.setdefault("width", samples + 2 + padding[1] * 2)
+        super().__init__(**kwargs)
+        self.samples = samples
+        self._values = array("f", bytes(4 * samples))
+        self._head = 0
+        self._count = 0
+        self._pushes = 0
+        self._cells: List[Deque[Tuple[str, Style]]] = []
+        self._cells_key: Hashable = None
+
+    @property
+    def history(self) -> List[float]:
+        """Kept samples from the oldest"""
+        values, head = self._values, self._head
+        ordered = values[head:] + values[:head]
+        return ordered[self.samples - self._count :].tolist()
+
+    def _column(self, value: float) -> Iterator[Tuple[str, Style]]:
+        """Cells of one sample, from the top row"""
+        filled, _ = self._style_tables()
+        level = self.quantise(value)
+        height = self._max_height
+        for h in range(height):
+            eighths = self._eighths(level, height - 1 - h)
+            yield LOWER_EIGHTHS[eighths], filled[h]
+
+    def _rebuild_cells(self) -> None:
+        width = self._max_width
+        blank = [(" ", style) for style in self._style_tables()[0]]
+        self._cells = [
+            deque([blank[h]] * width, maxlen=width) for h in range(self._max_height)
+        ]
+        for value in self.history[-width:] if width else ():
+            for row, cell in zip(self._cells, self._column(value)):
+                row.append(cell)
+        self._cells_key = self._row_prefix()
+
+    def push(self, value: float) -> None:
+        """Add a sample, only its column is rendered"""
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.samples
+        self._count = min(self._count + 1, self.samples)
+        self._pushes += 1
+        self.source_value = value
+        if self._cells_key == self._row_prefix():
+            for row, cell in zip(self._cells, self._column(value)):
+                row.append(cell)
+        else:
+            self._cells_key = None
+        self.refresh()
+
+    def update(self, value: float) -> bool:
+        self.push(value)
+        return True
+
+    def _rescale(self) -> None:
+        # Samples are kept as values, all columns are mapped again
+        self._cells_key = None
+        self._lines = None
+        self.refresh()
+
+    def _boundary(self) -> int:
+        return self._pushes
+
+    def _row(self, prefix, h, r1) -> Row:
+        if self._cells_key != prefix:
+            self._rebuild_cells()
+        return tuple(merge_runs(self._cells[h]))
+
+    def _dirty_region(self, r_old, r_new) -> Tuple[range, int, int]:
+        if r_old == r_new:
+            return range(0), 0, 0
+        # Columns shift, so every row of the chart changes
+        return range(self._max_height), 0, self._max_width
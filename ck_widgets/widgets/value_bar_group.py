@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence
+
+from textual.message import Message
+from textual.views import GridView
+
+from .frame_scheduler import FrameScheduler, shared_scheduler
+from .value_bar import _ValueBar
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+
+class ValueBarGroupChange(Message):
+    """Sent once per `ValueBarGroup.set_values` call which changed any bar
+
+    Queued messages of the same group are replaced by the newest one,
+    its `changed` then holds bars changed in all of them.
+    """
+
+    def __init__(self, sender: ValueBarGroup, changed: List[int]) -> None:
+        super().__init__(sender)
+        self.values = sender.values
+        self.changed = changed
+
+    def can_replace(self, message: Message) -> bool:
+        if isinstance(message, ValueBarGroupChange) and message.sender is self.sender:
+            message.changed = sorted(set(self.changed).union(message.changed))
+            return True
+        return False
+
+
+class ValueBarGroup(GridView):
+    """Bars laid out in a grid and updated together from one vector
+
+    ```python
+    group = ValueBarGroup([ValueBarH(max_value=40) for _ in range(200)], columns=4)
+    await group.set_values(samples)  # list or NumPy array
+    ```
+    """
+
+    def __init__(
+        self,
+        bars: Iterable[_ValueBar],
+        columns: int = 1,
+        row_size: Optional[int] = None,
+        name: str | None = None,
+        scheduler: Optional[FrameScheduler] = shared_scheduler,
+    ) -> None:
+        """ValueBarGroup constructor
+
+        Args:
+            bars: Bars of the group, filled row by row
+            columns: Number of grid columns
+            row_size: Height of grid rows, rows share the height when None
+            name: Widget uniqe name
+            scheduler: Set on the bars, changed bars are repainted together
+            in its next frame, None repaints them right away
+        """
+        super().__init__(name=name)
+        self.bars: List[_ValueBar] = list(bars)
+        self.columns = columns
+        self.row_size = row_size
+        self.scheduler = scheduler
+        for bar in self.bars:
+            bar.scheduler = scheduler
+
+    def __len__(self) -> int:
+        return len(self.bars)
+
+    async def on_mount(self) -> None:
+        rows = -(-len(self.bars) // self.columns)
+        self.grid.add_column("col", repeat=self.columns)
+        self.grid.add_row("row", repeat=rows, size=self.row_size)
+        self.grid.place(*self.bars)
+
+    @property
+    def values(self) -> List[int]:
+        return [bar.value for bar in self.bars]
+
+    def _quantise(self, values) -> List[int]:
+        bars = self.bars[: len(values)]
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            levels = []
+            for bar in bars:
+                cells = bar._max_value
+                if cells != bar._scale_cells:
+                    bar._update_scale(cells)
+                levels.append(cells * bar.resolution)
+            low = numpy.array([bar._low for bar in bars])
+            scale = numpy.array([bar._scale for bar in bars])
+            fills = ((values[: len(bars)] - low) * scale).astype(int)
+            return numpy.clip(fills, 0, levels).tolist()
+        return [bar.quantise(value) for value, bar in zip(values, bars)]
+
+    async def set_values(self, values: Sequence[float]) -> List[int]:
+        """Show `values` on the first `len(values)` bars
+
+        Values are mapped from each bar's `value_range` like in `update`,
+        all at once with NumPy. Changed bars are repainted together in the
+        next frame and one `ValueBarGroupChange` is sent. Returns indexes
+        of changed bars.
+        """
+        changed: List[int] = []
+        levels = self._quantise(values)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        for index, (value, level, bar) in enumerate(zip(values, levels, self.bars)):
+            bar.source_value = value
+            if bar.set_level(*divmod(level, bar.resolution)):
+                changed.append(index)
+        if changed:
+            await self.emit(ValueBarGroupChange(self, changed))
+        return changed
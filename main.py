@@ -1,5 +1,4 @@
 from textual.app import App
-from textual.reactive import Reactive
 from textual.views import GridView
 from textual.widgets import Footer, Header
 from textual import events
@@ -181,8 +180,6 @@ class Layout(GridView):
 
 
 class SimpleApp(App):
-    debug: Reactive[dict] = Reactive({})
-
     async def on_load(self, _: events.Load) -> None:
         await self.bind("q", "quit", "Quit")
 
@@ -193,16 +190,14 @@ class SimpleApp(App):
         await self.view.dock(self.layout, edge="left")
 
     async def handle_debug_status(self, message: DebugStatus):
-        self.status.debug = message.mes
+        self.status.write_line(message.mes)
 
     async def handle_value_bar_change(self, message: ValueBarChange):
-        self.debug["->"] = (
+        self.status.set_status(
+            message.sender.name,
             f"[blue][green]{message.fill}[/green] "
-            f"Value: [yellow]{message.value}[/yellow]/[red]{message.max_value}[/red][/blue]"
+            f"Value: [yellow]{message.value}[/yellow]/[red]{message.max_value}[/red][/blue]",
         )
-        t = str(self.debug).replace(", ", "\n")[1:-1]
-        self.status.debug = t
-        self.status.refresh()
 
 
 if __name__ == "__main__":
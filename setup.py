@@ -15,4 +15,5 @@ setup(
     author_email="igna.cwaniak@gmail.com",
     packages=find_packages(exclude=["not"]),
     install_requires=["rich", "textual"],
+    extras_require={"numpy": ["numpy"]},
 )
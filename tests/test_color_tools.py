@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from ck_widgets.color import color_tools
+from ck_widgets.color.color_tools import intern_key
+
+
+def test_intern_key_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(color_tools, "MAX_INTERNED_KEYS", 4)
+    first = intern_key(("first",))
+    assert intern_key(("first",)) == first
+
+    numbers = [intern_key(("many", index)) for index in range(10)]
+    assert len(set(numbers)) == 10
+    assert len(color_tools._interned_keys) == 4
+
+    # Evicted key gets a new number, old numbers are not reused
+    again = intern_key(("first",))
+    assert again != first
+    assert again not in numbers
+
+
+def test_intern_key_keeps_recently_used() -> None:
+    kept = intern_key(("kept",))
+    for index in range(color_tools.MAX_INTERNED_KEYS - 1):
+        intern_key(("other", index))
+        assert intern_key(("kept",)) == kept
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from rich.console import Console
+from rich.text import Text
+from textual.app import App
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import DebugWindow
+from ck_widgets.widgets import debug_window
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _lines(window: DebugWindow, width: int = 40) -> List[str]:
+    console = Console(width=width)
+    rows = debug_window._Rows(list(window._status.values()), Text())
+    with console.capture() as capture:
+        console.print(rows)
+    return capture.get().splitlines()
+
+
+def test_status_expires_after_ttl(monkeypatch) -> None:
+    clock = _Clock()
+    monkeypatch.setattr(debug_window, "monotonic", clock)
+    window = DebugWindow(status_ttl=10)
+    window.set_status("a", "1")
+    window.set_status("b", "2")
+    clock.now += 6
+    # Setting the same value keeps the key alive
+    window.set_status("a", "1")
+    clock.now += 5
+    window.expire_status()
+    assert window.status == {"a": "1"}
+    clock.now += 10
+    window.expire_status()
+    assert window.status == {}
+
+
+def test_status_expires_on_timer() -> None:
+    async def expire(app: App):
+        window = DebugWindow(status_ttl=0.05)
+        await app.view.dock(window)
+        await wait_idle(app)
+        window.set_status("a", "1")
+        await asyncio.sleep(0.15)
+        await wait_idle(app)
+        assert window.status == {}
+        return {}
+
+    run_once(expire)
+
+
+def test_status_order() -> None:
+    window = DebugWindow()
+    for key in ["b", "c", "a"]:
+        window.set_status(key, key)
+    window.set_status("c", "new")
+    assert list(window.status) == ["b", "c", "a"]
+    window.remove_status("b")
+    window.set_status("b", "again")
+    assert list(window.status) == ["c", "a", "b"]
+
+    window = DebugWindow(status_order=str)
+    for key in ["b", "c", "a"]:
+        window.set_status(key, key)
+    assert list(window.status) == ["a", "b", "c"]
+    window.set_status("aa", "")
+    assert list(window.status) == ["a", "aa", "b", "c"]
+
+
+def test_status_rows_are_rebuilt_on_change() -> None:
+    window = DebugWindow()
+    window.set_status("bar", "[yellow]1[/yellow]")
+    window.set_status("other", "x")
+    entry = window._status["bar"]
+    console = Console(width=40)
+    options = console.options
+    segments = entry.segments(console, options)
+    assert entry.segments(console, options) is segments
+
+    # Same value keeps the rendered line
+    window.set_status("bar", "[yellow]1[/yellow]")
+    assert window._status["bar"] is entry
+    assert entry.segments(console, options) is segments
+    assert _lines(window) == ["bar: 1", "other: x"]
+
+    window.set_status("bar", "[yellow]2[/yellow]")
+    assert window._status["bar"] is not entry
+    assert _lines(window) == ["bar: 2", "other: x"]
+
+    # Other width renders the line again
+    line = window._status["bar"].segments(console, options.update_width(5))
+    assert "".join(segment.text for segment in line) == "bar:…"
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from textual.app import App
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import ValueBarH
+from ck_widgets.widgets.frame_scheduler import FrameScheduler, ScheduledRefresh
+
+
+class _Repainted(ScheduledRefresh):
+    _closing = False
+    _closed = False
+
+    def __init__(self, scheduler: FrameScheduler) -> None:
+        self.scheduler = scheduler
+        self.repaints = 0
+
+    def refresh_now(self) -> None:
+        self.repaints += 1
+
+
+def test_requests_in_one_frame_repaint_once() -> None:
+    async def frame() -> None:
+        scheduler = FrameScheduler()
+        widget = _Repainted(scheduler)
+        calls: List[str] = []
+        for _ in range(5):
+            widget.refresh()
+            scheduler.request("key", lambda: calls.append("first"))
+            scheduler.request("key", lambda: calls.append("last"))
+        assert widget.repaints == 0
+        await asyncio.sleep(0)
+        assert widget.repaints == 1
+        assert calls == ["last"]
+        assert (scheduler.requests, scheduler.frames, scheduler.repaints) == (15, 1, 1)
+
+    asyncio.run(frame())
+
+
+def test_repaint_at_most_once_per_frame() -> None:
+    async def frames() -> None:
+        scheduler = FrameScheduler(fps=20)
+        widget = _Repainted(scheduler)
+        widget.refresh()
+        await asyncio.sleep(0)
+        assert widget.repaints == 1
+        # Next frame is due 50 ms after the first one
+        widget.refresh()
+        await asyncio.sleep(0.02)
+        widget.refresh()
+        assert widget.repaints == 1
+        await asyncio.sleep(0.05)
+        assert widget.repaints == 2
+        assert scheduler.frames == 2
+
+    asyncio.run(frames())
+
+
+def test_without_loop_repaints_right_away() -> None:
+    widget = _Repainted(FrameScheduler())
+    widget.refresh()
+    widget.refresh()
+    assert widget.repaints == 2
+
+
+def test_many_widgets_draw_screen_once() -> None:
+    async def many(app: App):
+        scheduler = FrameScheduler()
+        bars = [
+            ValueBarH(max_value=10, height=3, scheduler=scheduler) for _ in range(4)
+        ]
+        for bar in bars:
+            await app.view.dock(bar, edge="top", size=3)
+        await wait_idle(app)
+        frames, repaints = scheduler.frames, scheduler.repaints
+        draws: List[bool] = []
+        refresh = app.refresh
+
+        def counting_refresh(*args, **kwargs) -> None:
+            draws.append(True)
+            refresh(*args, **kwargs)
+
+        app.refresh = counting_refresh  # type: ignore
+        for level in range(1, 4):
+            for bar in bars:
+                bar.update(level)
+        # Frames are at most 60 per second
+        await asyncio.sleep(1 / 30)
+        assert len(draws) == 1
+        assert scheduler.frames == frames + 1
+        assert scheduler.repaints == repaints + 4
+        await wait_idle(app)
+        assert [bar.fill for bar in bars] == [3] * 4
+        return {}
+
+    run_once(many)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import random
+from typing import List, Optional
+
+import pytest
+
+from ck_widgets.widgets.height_index import HeightIndex
+
+
+class _Naive:
+    """Prefix sums over a plain list, reference for `HeightIndex`"""
+
+    def __init__(self, heights: List[int], gap: int) -> None:
+        self.heights = heights
+        self.gap = gap
+
+    def _slots(self) -> List[int]:
+        return [max(height, 0) + self.gap for height in self.heights]
+
+    def offset(self, index: int) -> int:
+        index = min(max(index, 0), len(self.heights))
+        return sum(self._slots()[:index])
+
+    def index_at(self, y: int) -> Optional[int]:
+        if y < 0:
+            return None
+        total = 0
+        for index, slot in enumerate(self._slots()):
+            total += slot
+            if total > y:
+                return index
+        return None
+
+
+def _height(rnd: random.Random) -> int:
+    # Negative heights are unknown ones, zero heights are kept too
+    return rnd.choice([-1, 0, 0, 1, 1, 2, 3, 5, 10])
+
+
+def _check(index: HeightIndex, naive: _Naive, rnd: random.Random) -> None:
+    heights = naive.heights
+    assert list(index) == heights
+    assert len(index) == len(heights)
+    assert index.total == naive.offset(len(heights))
+    for position in rnd.sample(range(-1, len(heights) + 2), min(6, len(heights) + 3)):
+        assert index.offset(position) == naive.offset(position)
+    for y in range(-1, naive.offset(len(heights)) + 2):
+        assert index.index_at(y) == naive.index_at(y)
+
+
+@pytest.mark.parametrize("gap", [0, 1, 2])
+@pytest.mark.parametrize("seed", range(8))
+def test_matches_naive_prefix_sums(gap: int, seed: int) -> None:
+    rnd = random.Random(seed)
+    heights = [_height(rnd) for _ in range(rnd.randrange(0, 20))]
+    index = HeightIndex(heights, gap=gap)
+    naive = _Naive(list(heights), gap)
+
+    for _ in range(300):
+        count = len(naive.heights)
+        operation = rnd.randrange(7)
+        if operation == 0 and count:
+            position = rnd.randrange(-count, count)
+            height = _height(rnd)
+            index[position] = height
+            naive.heights[position] = height
+            assert index[position] == height
+        elif operation == 1 and count:
+            # Few changes are applied to the tree, many rebuild it
+            changes = [
+                (rnd.randrange(count), _height(rnd))
+                for _ in range(rnd.choice([1, 2, count]))
+            ]
+            index.update(changes)
+            for position, height in changes:
+                naive.heights[position] = height
+        elif operation == 2:
+            new = [_height(rnd) for _ in range(rnd.randrange(4))]
+            index.extend(new)
+            naive.heights.extend(new)
+        elif operation == 3:
+            # Front drop, kept as zeros until compacted
+            end = rnd.randrange(count + 1)
+            assert index.splice(0, end) == naive.heights[:end]
+            del naive.heights[:end]
+        elif operation == 4:
+            start = rnd.randrange(count + 1)
+            end = rnd.randrange(start, count + 1)
+            new = [_height(rnd) for _ in range(rnd.randrange(4))]
+            assert index.splice(start, end, new) == naive.heights[start:end]
+            naive.heights[start:end] = new
+        elif operation == 5:
+            new = [_height(rnd) for _ in range(rnd.randrange(4))]
+            assert index.splice(count, count, new) == []
+            naive.heights.extend(new)
+        else:
+            index.append(height := _height(rnd))
+            naive.heights.append(height)
+        # Lookups build the tree, without them changes stay lazy
+        if rnd.random() < 0.5:
+            _check(index, naive, rnd)
+    _check(index, naive, rnd)
+
+
+def test_out_of_range_item() -> None:
+    index = HeightIndex([1, 2, 3])
+    with pytest.raises(IndexError):
+        index[3]
+    with pytest.raises(IndexError):
+        index[-4] = 1
+    assert index.index_at(6) is None
+    assert index.offset(10) == 6
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from rich.style import Style
+from textual.app import App
+from textual.geometry import Size
+
+from ck_widgets.benchmarks.harness import run_once
+from ck_widgets.widgets import ValueBarH, instrumentation
+
+
+def test_instrumentation_counts_styles_without_patching_style() -> None:
+    new = Style.__dict__.get("__new__")
+    bar = ValueBarH(
+        max_value=20, height=3, color=["rgb(1,2,3)", "rgb(3,2,1)"], scheduler=None
+    )
+    bar._size = Size(bar.width, bar.height)
+
+    async def render(app: App):
+        instrumentation.reset()
+        instrumentation.enable()
+        try:
+            bar.render_lines()
+        finally:
+            instrumentation.disable()
+        return {}
+
+    run_once(render)
+    stats = instrumentation.stats()
+    instrumentation.reset()
+
+    stat = stats[(bar.name, "render_lines")]
+    assert stat.calls == 1
+    assert stat.cells == 22 * 3
+    assert stat.styles > 0
+    assert Style.__dict__.get("__new__") is new
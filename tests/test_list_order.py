@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+from typing import Dict, List
+
+import pytest
+from rich.text import Text
+from textual.app import App
+from textual.widgets import Static
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import ListOrder, ListViewUo
+
+
+def _rows(list_view: ListViewUo) -> List[object]:
+    rows = list(list_view.window.layout._widgets)
+    return [row.renderable if isinstance(row, Static) else row for row in rows]
+
+
+def _check(order: ListOrder, list_view: ListViewUo) -> None:
+    rows = _rows(list_view)
+    assert [id(row) for row in rows] == [id(item) for item in order.shown]
+    where = order.where or (lambda item: True)
+    assert {id(row) for row in rows} == {id(item) for item in order.items if where(item)}
+    if order.key is not None:
+        row_keys = [order.key(row) for row in rows]
+        assert row_keys == sorted(row_keys, reverse=order.reverse)
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_reference_sort(lightweight: bool, seed: int) -> None:
+    rnd = random.Random(seed)
+    priority: Dict[int, int] = {}
+    done: Dict[int, bool] = {}
+
+    def new_item(number: int) -> Text:
+        item = Text(f"task {number}")
+        priority[id(item)] = rnd.randrange(10)
+        done[id(item)] = rnd.random() < 0.3
+        return item
+
+    def by_priority(item: Text) -> int:
+        return priority[id(item)]
+
+    def not_done(item: Text) -> bool:
+        return not done[id(item)]
+
+    async def shuffle(app: App):
+        list_view = ListViewUo(lightweight=lightweight)
+        await app.view.dock(list_view)
+        await wait_idle(app)
+        order = ListOrder(list_view, key=by_priority, where=not_done)
+        await order.set_items(new_item(number) for number in range(20))
+        _check(order, list_view)
+
+        for step in range(150):
+            operation = rnd.randrange(6)
+            items = order.items
+            if operation == 0 or not items:
+                await order.add(new_item(100 + step))
+            elif operation == 1:
+                await order.remove(rnd.choice(items))
+            elif operation == 2:
+                item = rnd.choice(items)
+                priority[id(item)] = rnd.randrange(10)
+                done[id(item)] = rnd.random() < 0.3
+                await order.refresh_item(item)
+            elif operation == 3:
+                await order.set_filter(rnd.choice([None, not_done]))
+            elif operation == 4:
+                await order.set_key(by_priority, reverse=rnd.random() < 0.5)
+            else:
+                await order.add_items(new_item(200 + step * 3 + n) for n in range(3))
+            _check(order, list_view)
+        await wait_idle(app)
+        return {}
+
+    run_once(shuffle)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_equal_keys_keep_adding_order(reverse: bool) -> None:
+    async def ties(app: App):
+        list_view = ListViewUo(lightweight=True)
+        await app.view.dock(list_view)
+        await wait_idle(app)
+        order = ListOrder(list_view, key=len, reverse=reverse)
+        first, second, longer = Text("a"), Text("b"), Text("ccc")
+        await order.set_items([first, longer])
+        await order.add(second)
+        short = [first, second]
+        assert _rows(list_view) == ([longer] + short if reverse else short + [longer])
+        return {}
+
+    run_once(ties)
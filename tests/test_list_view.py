@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, List
+
+import pytest
+from rich.text import Text
+from textual.app import App
+from textual.geometry import Offset
+from textual.widget import Widget
+from textual.widgets import Static
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import ListViewUo
+from ck_widgets.widgets.list_view import VirtualWindowView
+
+
+def _texts(list_view: ListViewUo) -> List[str]:
+    """Plain text of every row, widget or lightweight"""
+    rows = list_view.window.layout.get_widgets()
+    return [str(row.renderable if isinstance(row, Static) else row) for row in rows]
+
+
+async def _docked(app: App, list_view: ListViewUo) -> ListViewUo:
+    await app.view.dock(list_view)
+    await wait_idle(app)
+    return list_view
+
+
+async def _wait_for(app: App, done: Callable[[], bool], timeout: float = 5.0) -> None:
+    """Wait for timers of the app until `done` is true"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not done():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+    await wait_idle(app)
+
+
+def test_virtual_list_is_changed_only_through_window() -> None:
+    async def virtual(app: App):
+        list_view = ListViewUo.virtual(lambda index: Text(f"row {index}"), count=1000)
+        assert isinstance(list_view.window, VirtualWindowView)
+        await app.view.dock(list_view)
+        await wait_idle(app)
+        with pytest.raises(TypeError):
+            await list_view.add_widget(Text("new"))
+        with pytest.raises(TypeError):
+            await list_view.remove_widget_by_index(0)
+        with pytest.raises(TypeError):
+            async with list_view.batch():
+                pass
+
+        await list_view.window.update([Text(f"item {index}") for index in range(5)])
+        await wait_idle(app)
+        assert list_view.window.layout.index_at(4) == 4
+        assert list_view.window.layout.index_at(5) is None
+        return {}
+
+    run_once(virtual)
+
+
+def test_virtual_list_mounts_widget_items() -> None:
+    widgets = [Static(f"row {index}") for index in range(1000)]
+
+    async def scroll(app: App):
+        list_view = ListViewUo.virtual(widgets)
+        await app.view.dock(list_view)
+        await wait_idle(app)
+        list_view.scroll_to_index(100)
+        await wait_idle(app)
+        shown = list(list_view.window.layout.get_widgets())
+        assert widgets[100] in shown and widgets[0] not in shown
+        assert all(widget in app.children for widget in shown)
+        return {}
+
+    run_once(scroll)
+
+
+def test_add_and_remove_single_widgets() -> None:
+    async def single(app: App):
+        list_view = await _docked(
+            app, ListViewUo([Text(f"row {index}") for index in range(4)])
+        )
+        first = list_view.window.layout.get_widgets()[0]
+        new = Static("new")
+        await list_view.add_widget(new, index=2)
+        await list_view.add_widget(Text("last"))
+        await list_view.add_widget(Text("first"), index=-5)
+        await wait_idle(app)
+        assert _texts(list_view) == [
+            "first", "row 0", "row 1", "new", "row 2", "row 3", "last"
+        ]
+        assert new in app.children
+
+        await list_view.remove_widget(new)
+        await list_view.remove_widget_by_index(1)
+        await list_view.remove_widget_by_index(99)
+        await wait_idle(app)
+        assert _texts(list_view) == ["first", "row 1", "row 2", "row 3"]
+        # Statics made for renderables are stopped, given widgets are kept
+        assert first not in app.children
+        assert new in app.children
+        assert list_view.window.layout.index_at(3) == 3
+        return {}
+
+    run_once(single)
+
+
+def test_batch_arranges_once() -> None:
+    async def batch(app: App):
+        list_view = await _docked(app, ListViewUo())
+        window = list_view.window
+        layouts: List[bool] = []
+        refresh = window.refresh
+
+        def counting_refresh(repaint: bool = True, layout: bool = False) -> None:
+            layouts.append(layout)
+            refresh(repaint, layout)
+
+        window.refresh = counting_refresh  # type: ignore
+        async with list_view.batch():
+            async with list_view.batch():
+                await list_view.add_widget(Text("a"))
+            await list_view.add_widgets([Text("b"), Text("c")])
+            await list_view.remove_widget_by_index(0)
+            assert layouts.count(True) == 0
+        assert layouts.count(True) == 1
+        await wait_idle(app)
+        assert _texts(list_view) == ["b", "c"]
+        assert list_view.window.layout.index_at(1) == 1
+        assert list_view.window.layout.index_at(2) is None
+        return {}
+
+    run_once(batch)
+
+
+def test_bulk_changes() -> None:
+    async def bulk(app: App):
+        list_view = await _docked(app, ListViewUo([Text("x"), Text("y")]))
+        rows = [f"row {index}" for index in range(6)]
+        await list_view.add_widgets([Text(row) for row in rows], 1)
+        await wait_idle(app)
+        assert _texts(list_view) == ["x", *rows, "y"]
+
+        removed = await list_view.remove_widgets([0, 2, 2, 50, -1])
+        assert [str(widget.renderable) for widget in removed] == ["x", "row 1"]
+        removed = await list_view.remove_widgets(
+            lambda widget: str(widget.renderable).endswith("3")
+        )
+        assert [str(widget.renderable) for widget in removed] == ["row 3"]
+        await wait_idle(app)
+        assert _texts(list_view) == ["row 0", "row 2", "row 4", "row 5", "y"]
+
+        removed = await list_view.replace_range(1, -1, [Text("new")])
+        await wait_idle(app)
+        assert [str(widget.renderable) for widget in removed] == [
+            "row 2",
+            "row 4",
+            "row 5",
+        ]
+        assert _texts(list_view) == ["row 0", "new", "y"]
+        assert not any(widget in app.children for widget in removed)
+        assert list_view.window.layout.index_at(2) == 2
+        assert list_view.window.layout.index_at(3) is None
+        return {}
+
+    run_once(bulk)
+
+
+def test_stream_from_async_iterator_keeps_newest() -> None:
+    async def rows():
+        for index in range(20):
+            yield Text(f"row {index}")
+
+    async def stream(app: App):
+        list_view = ListViewUo.stream(rows(), max_items=5, batch_size=3, fps=100)
+        await _docked(app, list_view)
+        await _wait_for(app, lambda: list_view._stream is None)
+        assert _texts(list_view) == [f"row {index}" for index in range(15, 20)]
+        # Dropped rows are stopped
+        statics = [child for child in app.children if isinstance(child, Static)]
+        assert len(statics) == 5
+        return {}
+
+    run_once(stream)
+
+
+def test_stream_from_queue() -> None:
+    async def stream(app: App):
+        queue: asyncio.Queue[Text] = asyncio.Queue()
+        list_view = await _docked(app, ListViewUo(lightweight=True))
+        await list_view.consume(queue, batch_size=2, fps=100)
+        for index in range(5):
+            queue.put_nowait(Text(f"row {index}"))
+        await _wait_for(app, lambda: len(list_view.window.layout) == 5)
+        assert _texts(list_view) == [f"row {index}" for index in range(5)]
+        await list_view.stop_stream()
+        queue.put_nowait(Text("late"))
+        await asyncio.sleep(0.05)
+        await wait_idle(app)
+        assert len(list_view.window.layout) == 5
+        return {}
+
+    run_once(stream)
+
+
+def test_update_stops_replaced_statics() -> None:
+    async def update(app: App):
+        list_view = await _docked(app, ListViewUo([Text("a"), Text("b")]))
+        window = list_view.window
+        old = list(window.layout.get_widgets())
+        await window.update([Text("c"), old[1]])
+        await wait_idle(app)
+        assert _texts(list_view) == ["c", "b"]
+        assert old[0] not in app.children
+        assert old[1] in app.children
+        return {}
+
+    run_once(update)
+
+
+def test_follow_tail() -> None:
+    async def follow(app: App):
+        list_view = await _docked(app, ListViewUo(follow_tail=True, lightweight=True))
+        window = list_view.window
+
+        def tail() -> int:
+            layout = window.layout
+            return layout.item_offset(len(layout)) - window.size.height
+
+        await list_view.add_widgets([Text(f"row {index}") for index in range(100)])
+        await wait_idle(app)
+        assert tail() > 0
+        assert window.scroll_y == list_view.y == tail()
+        await list_view.add_widget(Text("row 100"))
+        await wait_idle(app)
+        assert window.scroll_y == list_view.y == tail()
+
+        # Scrolled up, new rows do not move the view
+        list_view.y = list_view.target_y = 10
+        await wait_idle(app)
+        assert not window.following
+        await list_view.add_widgets([Text("more")] * 5)
+        await wait_idle(app)
+        assert window.scroll_y == list_view.y == 10
+
+        # Back at the bottom, following again
+        list_view.y = list_view.target_y = tail()
+        await wait_idle(app)
+        assert window.following
+        await list_view.add_widget(Text("last"))
+        await wait_idle(app)
+        assert window.scroll_y == list_view.y == tail()
+        assert list_view.index_at_offset(list_view.y + window.size.height - 1) == 106
+        return {}
+
+    run_once(follow)
+
+
+def test_max_items_drops_from_front() -> None:
+    async def trim(app: App):
+        list_view = await _docked(app, ListViewUo(max_items=3))
+        widgets = [Static(f"row {index}") for index in range(8)]
+        for widget in widgets:
+            await list_view.add_widget(widget)
+        await wait_idle(app)
+        assert _texts(list_view) == ["row 5", "row 6", "row 7"]
+        # Positions stay right after the front was dropped
+        assert list_view.window.layout.index(widgets[6]) == 1
+        await list_view.remove_widget(widgets[6])
+        await wait_idle(app)
+        assert _texts(list_view) == ["row 5", "row 7"]
+        return {}
+
+    run_once(trim)
+
+
+def test_lightweight_rows_and_promote() -> None:
+    async def lightweight(app: App):
+        rows = [Text("a"), Text("b\nb2"), Text("c")]
+        list_view = await _docked(app, ListViewUo(rows, lightweight=True))
+        layout = list_view.window.layout
+        assert all(item is row for item, row in zip(layout.get_widgets(), rows))
+        assert not any(isinstance(child, Static) for child in app.children)
+        assert layout.item_offset(2) == 3
+        blocks = layout._shown_blocks
+        assert [block.rows for block in blocks] == [tuple(rows)]
+        assert all(block in app.children for block in blocks)
+
+        widget = await list_view.promote(1)
+        await wait_idle(app)
+        assert isinstance(widget, Static) and widget.renderable is rows[1]
+        assert layout.get_widgets()[1] is widget
+        assert widget in app.children
+        shown = sorted(str(row) for block in blocks for row in block.rows)
+        assert (len(blocks), shown) == (2, ["a", "c"])
+        assert layout.item_offset(2) == 3
+        assert await list_view.promote(1) is widget
+        return {}
+
+    run_once(lightweight)
+
+
+def test_arrangement_is_cropped_to_viewport() -> None:
+    async def crop(app: App):
+        widgets = [Static(f"row {index}") for index in range(1000)]
+        list_view = await _docked(app, ListViewUo(widgets))
+        window = list_view.window
+        layout = window.layout
+        height = window.size.height
+
+        def placed(scroll_y: int) -> List[Widget]:
+            arrangement = layout.arrange(window.size, Offset(0, scroll_y))
+            return [placement.widget for placement in arrangement if placement.widget]
+
+        assert placed(0) == widgets[:height]
+        measured: List[int] = []
+        pending = layout._pending
+
+        def recording_pending(render_width: int):
+            items = list(pending(render_width))
+            measured.append(len(items))
+            return iter(items)
+
+        layout._pending = recording_pending
+        list_view.y = list_view.target_y = 500
+        await wait_idle(app)
+        assert window.scroll_y == 500
+        assert placed(500) == widgets[500 : 500 + height]
+        # Only rows coming into view are measured again, after their resize
+        assert measured and sum(measured) <= height
+        return {}
+
+    run_once(crop)
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_scroll_to_index(lightweight: bool) -> None:
+    # Every third row is two lines high
+    rows = [Text(f"row {index}" + "\nmore" * (index % 3 == 0)) for index in range(300)]
+
+    def offset(index: int) -> int:
+        return index + -(-index // 3)
+
+    async def scroll(app: App):
+        list_view = await _docked(app, ListViewUo(rows, lightweight=lightweight))
+        window = list_view.window
+        list_view.scroll_to_index(100)
+        await wait_idle(app)
+        assert list_view.y == window.scroll_y == offset(100)
+        assert list_view.index_at_offset(list_view.y) == 100
+        assert list_view.index_at_offset(list_view.y + 3) == 102
+        assert list_view.index_at_offset(offset(300)) is None
+
+        # Near the end the list is scrolled as far as it goes
+        list_view.scroll_to_index(299)
+        await wait_idle(app)
+        assert window.scroll_y == offset(300) - window.size.height
+        return {}
+
+    run_once(scroll)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from rich.console import Console
+from textual import events
+from textual.app import App
+from textual.geometry import Size
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import ValueBarChange, ValueBarH, ValueBarV
+
+# Mouse down on 2, drag with repeated positions, release on 9
+DRAG = [3, 3, 4, 5, 5, 6, 7, 8, 8, 9]
+
+
+def _mouse(cls, app: App, x: int) -> events.MouseEvent:
+    return cls(app, x, 1, 0, 0, 1, False, False, False, screen_x=x, screen_y=1)
+
+
+async def _docked_bar(app: App, policy: str) -> ValueBarH:
+    bar = ValueBarH(
+        max_value=20, height=3, emit_policy=policy, emit_rate=0.5, emit_delay=1.0
+    )
+    await app.view.dock(bar, edge="top", size=3)
+    await wait_idle(app)
+    return bar
+
+
+def _record_changes(bar: ValueBarH) -> List[ValueBarChange]:
+    sent: List[ValueBarChange] = []
+    emit = bar.emit
+
+    async def recording_emit(message) -> bool:
+        if isinstance(message, ValueBarChange):
+            sent.append(message)
+        return await emit(message)
+
+    bar.emit = recording_emit  # type: ignore
+    return sent
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        # Down, every move and up
+        ("always", 12),
+        # Down, 7 different fills and up with the final value
+        ("change", 9),
+        # First change and the final one
+        ("throttle", 2),
+        ("debounce", 1),
+    ],
+)
+def test_drag_message_count(policy: str, expected: int) -> None:
+    async def drag(app: App):
+        bar = await _docked_bar(app, policy)
+        sent = _record_changes(bar)
+        app.post_message_no_wait(_mouse(events.MouseDown, app, 2))
+        for x in DRAG:
+            app.post_message_no_wait(_mouse(events.MouseMove, app, x))
+        app.post_message_no_wait(_mouse(events.MouseUp, app, DRAG[-1]))
+        await wait_idle(app)
+        assert len(sent) == expected
+        assert (sent[-1].value, sent[-1].fill) == (bar.value, bar.fill)
+        assert bar.fill == DRAG[-1]
+        return {}
+
+    run_once(drag)
+
+
+def test_drag_coalesce_sends_final_fill() -> None:
+    async def drag(app: App):
+        bar = await _docked_bar(app, "coalesce")
+        sent = _record_changes(bar)
+        app.post_message_no_wait(_mouse(events.MouseDown, app, 2))
+        for x in DRAG:
+            app.post_message_no_wait(_mouse(events.MouseMove, app, x))
+        app.post_message_no_wait(_mouse(events.MouseUp, app, DRAG[-1]))
+        await wait_idle(app)
+        assert 1 <= len(sent) <= 9
+        assert (sent[-1].value, sent[-1].fill) == (bar.value, bar.fill)
+        return {}
+
+    run_once(drag)
+
+
+@pytest.mark.parametrize("policy", ["change", "throttle", "debounce", "coalesce"])
+def test_leave_without_change_sends_nothing(policy: str) -> None:
+    async def hover(app: App):
+        bar = await _docked_bar(app, policy)
+        sent = _record_changes(bar)
+        app.post_message_no_wait(_mouse(events.MouseMove, app, 5))
+        await wait_idle(app)
+        await bar.post_message(events.Leave(bar))
+        await wait_idle(app)
+        bar.update(7)
+        await bar.post_message(events.Leave(bar))
+        await wait_idle(app)
+        assert sent == []
+        return {}
+
+    run_once(hover)
+
+
+@pytest.mark.parametrize(
+    "value_range, high_resolution, value, level",
+    [
+        # Values in cells
+        (None, False, 7, 7),
+        (None, False, 7.9, 7),
+        (None, False, -3, 0),
+        (None, False, 25, 20),
+        (None, True, 7.5, 60),
+        # Values from the range, offset and clamped
+        ((0, 255), False, 128, 10),
+        ((0, 255), False, 300, 20),
+        ((-1, 1), False, 0.0, 10),
+        ((-1, 1), True, -0.95, 4),
+        ((10, 10), False, 10, 0),
+    ],
+)
+def test_quantise(value_range, high_resolution: bool, value: float, level: int) -> None:
+    bar = ValueBarH(
+        max_value=20, value_range=value_range, high_resolution=high_resolution
+    )
+    assert bar.quantise(value) == level
+
+
+def test_update_maps_value_onto_cells() -> None:
+    bar = ValueBarH(max_value=20, value_range=(0, 255), high_resolution=True)
+    assert bar.update(100)
+    assert (bar.source_value, bar.value, bar.fill, bar.partial) == (100, 7, 7, 6)
+    bar.value_range = (0, 100)
+    assert (bar.value, bar.fill, bar.partial) == (20, 20, 0)
+
+
+def test_update_refreshes_only_on_new_level() -> None:
+    bar = ValueBarH(max_value=20, value_range=(0, 100), scheduler=None)
+    refreshes: List[bool] = []
+    bar.refresh = lambda *args, **kwargs: refreshes.append(True)  # type: ignore
+    assert bar.update(50)
+    count = len(refreshes)
+    assert count
+    assert not bar.update(50)
+    assert not bar.update(52.4)
+    assert len(refreshes) == count
+    assert bar.update(55)
+    assert len(refreshes) > count
+
+
+def test_resize_refreshes_once() -> None:
+    async def resize(app: App):
+        bar = await _docked_bar(app, "always")
+        refreshes: List[bool] = []
+        bar.refresh = lambda *args, **kwargs: refreshes.append(True)  # type: ignore
+        await bar.post_message(events.Resize(bar, Size(22, 3)))
+        await wait_idle(app)
+        assert len(refreshes) == 1
+        return {}
+
+    run_once(resize)
+
+
+def _high_resolution_bar(cls, reversed: bool, partial: int):
+    size = {"height": 3} if cls is ValueBarH else {"width": 3}
+    bar = cls(
+        max_value=4,
+        reversed=reversed,
+        high_resolution=True,
+        color="red",
+        bg_color="blue",
+        scheduler=None,
+        **size,
+    )
+    bar.set_level(2, partial)
+    return bar
+
+
+@pytest.mark.parametrize(
+    "cls, reversed, partial, cells, partial_cell",
+    [
+        (ValueBarH, False, 0, "██  ", None),
+        (ValueBarH, False, 1, "██▏ ", 2),
+        (ValueBarH, False, 7, "██▉ ", 2),
+        # Fill grows from the right, the partial cell is drawn inverted
+        (ValueBarH, True, 0, "  ██", None),
+        (ValueBarH, True, 1, " ▉██", 1),
+        (ValueBarH, True, 7, " ▏██", 1),
+        # Rows from the top, upper part of the cell is drawn inverted
+        (ValueBarV, False, 0, "██  ", None),
+        (ValueBarV, False, 1, "██▇ ", 2),
+        (ValueBarV, False, 7, "██▁ ", 2),
+        (ValueBarV, True, 0, "  ██", None),
+        (ValueBarV, True, 1, " ▁██", 1),
+        (ValueBarV, True, 7, " ▇██", 1),
+    ],
+)
+def test_high_resolution_partial_cell(
+    cls, reversed: bool, partial: int, cells: str, partial_cell
+) -> None:
+    bar = _high_resolution_bar(cls, reversed, partial)
+    text = bar.render_fill()
+    assert text.plain.replace("\n", "") == cells
+    inverted = reversed == (cls is ValueBarH)
+    console = Console()
+    offsets = [offset for offset, char in enumerate(text.plain) if char != "\n"]
+    for cell, offset in enumerate(offsets):
+        style = text.get_style_at_offset(console, offset)
+        assert bool(style.reverse) == (cell == partial_cell and inverted)
+        if cell == partial_cell:
+            assert style.bgcolor.name == "blue"
+
+
+@pytest.mark.parametrize("partial", range(8))
+def test_high_resolution_update_sets_partial(partial: int) -> None:
+    bar = ValueBarH(max_value=4, value_range=(0, 4), high_resolution=True)
+    bar.update(2 + partial / 8)
+    assert (bar.fill, bar.partial) == (2, partial)
+    expected = "██" + (" ▏▎▍▌▋▊▉"[partial]) + " "
+    assert _high_resolution_bar(ValueBarH, False, partial).render_fill().plain == (
+        expected + "\n"
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from textual.app import App
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import ValueBarGroup, ValueBarGroupChange, ValueBarH
+
+
+def test_set_values_updates_bars() -> None:
+    bars = [ValueBarH(max_value=10, value_range=(0, 1)) for _ in range(3)]
+    group = ValueBarGroup(bars, scheduler=None)
+    assert all(bar.scheduler is None for bar in bars)
+
+    async def set_values(app: App):
+        await app.view.dock(group)
+        await wait_idle(app)
+        assert await group.set_values([0.5, 0.0, 1.0]) == [0, 2]
+        assert group.values == [5, 0, 10]
+        assert await group.set_values([0.5, 0.0, 1.0]) == []
+        return {}
+
+    run_once(set_values)
+
+
+def test_replaced_change_keeps_all_changed_bars() -> None:
+    group = ValueBarGroup([ValueBarH(max_value=10) for _ in range(4)])
+    first = ValueBarGroupChange(group, [0, 3])
+    second = ValueBarGroupChange(group, [1, 3])
+    assert first.can_replace(second)
+    assert second.changed == [0, 1, 3]
+
+    other = ValueBarGroupChange(ValueBarGroup([]), [2])
+    assert not other.can_replace(second)
+    assert second.changed == [0, 1, 3]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import List
+
+from textual import events
+from textual.app import App
+from textual.geometry import Size
+
+from ck_widgets.benchmarks.harness import run_once, wait_idle
+from ck_widgets.widgets import ValueBarChange, ValueBarHistory
+
+
+def _mouse(cls, app: App, x: int, y: int) -> events.MouseEvent:
+    return cls(app, x, y, 0, 0, 1, False, False, False, screen_x=x, screen_y=y)
+
+
+def _columns(chart: ValueBarHistory) -> List[str]:
+    """Chart cells from the top row, one string per row"""
+    return chart.render_fill().plain.splitlines()
+
+
+def _history(**kwargs) -> ValueBarHistory:
+    return ValueBarHistory(
+        samples=4, max_value=4, value_range=(0, 100), high_resolution=True, **kwargs
+    )
+
+
+def test_push_before_mount_is_kept_once() -> None:
+    chart = _history()
+    chart.push(10.0)
+    chart.push(50.0)
+
+    async def mount(app: App):
+        await app.view.dock(chart, edge="top", size=6)
+        await wait_idle(app)
+        assert chart.history == [10.0, 50.0]
+        assert _columns(chart) == ["    ", "    ", "   █", "  ▃█"]
+        return {}
+
+    run_once(mount)
+
+
+def test_resize_maps_kept_samples_again() -> None:
+    chart = _history()
+
+    async def resize(app: App):
+        await app.view.dock(chart, edge="top", size=6)
+        await wait_idle(app)
+        chart.push(100.0)
+        await chart.post_message(events.Resize(chart, Size(6, 6)))
+        await wait_idle(app)
+        assert chart.history == [100.0]
+        assert _columns(chart) == ["   █"] * 4
+
+        # Scale is reset by the range, resize maps samples without pushing
+        chart.value_range = (0, 200)
+        await chart.post_message(events.Resize(chart, Size(6, 6)))
+        await wait_idle(app)
+        assert chart.history == [100.0]
+        assert _columns(chart) == ["    ", "    ", "   █", "   █"]
+        return {}
+
+    run_once(resize)
+
+
+def test_value_range_change_maps_samples_again() -> None:
+    chart = _history()
+
+    async def change_range(app: App):
+        await app.view.dock(chart, edge="top", size=6)
+        await wait_idle(app)
+        chart.push(50.0)
+        assert _columns(chart)[-2:] == ["   █", "   █"]
+        chart.value_range = (0, 50)
+        await wait_idle(app)
+        assert chart.history == [50.0]
+        assert _columns(chart) == ["   █"] * 4
+        return {}
+
+    run_once(change_range)
+
+
+def test_click_does_not_change_history() -> None:
+    chart = _history()
+
+    async def click(app: App):
+        await app.view.dock(chart, edge="top", size=6)
+        await wait_idle(app)
+        chart.push(25.0)
+        sent: List[ValueBarChange] = []
+        emit = chart.emit
+
+        async def recording_emit(message) -> bool:
+            if isinstance(message, ValueBarChange):
+                sent.append(message)
+            return await emit(message)
+
+        chart.emit = recording_emit  # type: ignore
+        app.post_message_no_wait(_mouse(events.MouseDown, app, 2, 3))
+        app.post_message_no_wait(_mouse(events.MouseUp, app, 2, 3))
+        await wait_idle(app)
+        await chart.post_message(events.Leave(chart))
+        await wait_idle(app)
+        assert sent == []
+        assert chart.history == [25.0]
+        assert (chart.fill, chart.source_value) == (0, 25.0)
+        return {}
+
+    run_once(click)